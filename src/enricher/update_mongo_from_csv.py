@@ -14,6 +14,7 @@ import time
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 import requests
 from pymongo import DeleteMany, UpdateMany
@@ -34,7 +35,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Residential classification codes
-RESIDENTIAL_CLASSES = {"R", "X", "P"}
+RESIDENTIAL_CLASSES = frozenset("RXP")
 
 # Fields to extract from CSV and map to MongoDB
 ADDRESS_FIELD_MAPPING = {
@@ -60,8 +61,22 @@ def is_residential(class_value: str) -> bool:
     """Check if the class indicates a residential property."""
     if pd.isna(class_value):
         return False
-    # Class values may have trailing spaces
-    return class_value.strip()[:1] in RESIDENTIAL_CLASSES
+    # Class values may have trailing spaces, which the first character never sees;
+    # only strip when the value is padded on the left
+    first = class_value[:1]
+    if first.isspace():
+        first = class_value.lstrip()[:1]
+    return first in RESIDENTIAL_CLASSES
+
+
+def residential_mask(class_values: pd.Series) -> pd.Series:
+    """Check a whole column of class values at once, with the same rules as is_residential."""
+    # Class codes come from a small alphabet, so classify each distinct value once and
+    # spread the result over the rows by category code (-1, a missing value, picks False)
+    classes = class_values.astype("category")
+    categories = classes.cat.categories.astype("string")
+    residential = np.append(categories.str.lstrip().str[:1].isin(RESIDENTIAL_CLASSES), False)
+    return pd.Series(residential[classes.cat.codes.to_numpy()], index=class_values.index)
 
 
 def ensure_2dsphere_index(collection, field_name: str = LOCATION_FIELD) -> None:
@@ -99,55 +114,57 @@ def process_chunk(
     Returns:
         Dictionary with counts of updates and deletes
     """
+    if uid_field not in chunk.columns:
+        return {"updates": 0, "deletes": 0}
+
+    # Work out which rows to update and which to delete over whole columns, not row by row
+    uids = chunk[uid_field]
+    # Test truthiness on object values, so nullable integer and Arrow uid columns work too
+    has_uid = uids.notna() & uids.astype(object).fillna("").astype(bool)
+    if "class" in chunk.columns:
+        residential = has_uid & residential_mask(chunk["class"])
+    else:
+        residential = pd.Series(False, index=chunk.index)
+    non_residential = has_uid & ~residential
+
     operations = []
     update_count = 0
-    delete_count = 0
-
-    for _, row in chunk.iterrows():
-        uid = row.get(uid_field)
-        if pd.isna(uid) or not uid:
-            continue
 
-        class_value = row.get("class", "")
-
-        if is_residential(class_value):
-            # Build update document for residential properties
-            update_doc = {}
-            for csv_field, mongo_field in ADDRESS_FIELD_MAPPING.items():
-                value = row.get(csv_field)
-                if pd.notna(value):
-                    # Convert numpy types to Python native types
-                    if hasattr(value, "item"):
-                        value = value.item()
-                    update_doc[mongo_field] = value
-
-            # Create GeoJSON Point from latitude and longitude
-            latitude = row.get("latitude")
-            longitude = row.get("longitude")
-            if pd.notna(latitude) and pd.notna(longitude):
-                # Convert numpy types to Python native types
-                if hasattr(latitude, "item"):
-                    latitude = latitude.item()
-                if hasattr(longitude, "item"):
-                    longitude = longitude.item()
-                # GeoJSON Point format: [longitude, latitude]
-                update_doc[LOCATION_FIELD] = {
-                    "type": "Point",
-                    "coordinates": [float(longitude), float(latitude)]
-                }
-
-            if update_doc:
-                operations.append(
-                    UpdateMany(
-                        {"uid": uid},
-                        {"$set": update_doc},
-                    )
+    # Select and rename the address columns once; to_dict("records") already
+    # converts numpy values to Python native types
+    address_fields = [field for field in ADDRESS_FIELD_MAPPING if field in chunk.columns]
+    records = (
+        chunk.loc[residential, address_fields]
+        .rename(columns=ADDRESS_FIELD_MAPPING)
+        .to_dict("records")
+    )
+    for uid, record in zip(uids[residential].tolist(), records):
+        # Build update document for residential properties, leaving out missing values
+        update_doc = {field: value for field, value in record.items() if pd.notna(value)}
+
+        # Create GeoJSON Point from latitude and longitude
+        latitude = record.get(ADDRESS_FIELD_MAPPING["latitude"])
+        longitude = record.get(ADDRESS_FIELD_MAPPING["longitude"])
+        if pd.notna(latitude) and pd.notna(longitude):
+            # GeoJSON Point format: [longitude, latitude]
+            update_doc[LOCATION_FIELD] = {
+                "type": "Point",
+                "coordinates": [float(longitude), float(latitude)]
+            }
+
+        if update_doc:
+            operations.append(
+                UpdateMany(
+                    {"uid": uid},
+                    {"$set": update_doc},
                 )
-                update_count += 1
-        else:
-            # Delete non-residential documents
-            operations.append(DeleteMany({"uid": uid}))
-            delete_count += 1
+            )
+            update_count += 1
+
+    # Delete non-residential documents
+    delete_uids = uids[non_residential].tolist()
+    operations.extend(DeleteMany({"uid": uid}) for uid in delete_uids)
+    delete_count = len(delete_uids)
 
     # Execute bulk operations
     if operations:
@@ -213,7 +230,13 @@ def update_mongo_from_found_csv(
             # Process CSV in chunks with tqdm progress bar
             logger.info(f"Processing CSV in chunks of {chunk_size:,}...")
 
-            chunks = pd.read_csv(csv_path, chunksize=chunk_size, low_memory=False)
+            # Only the UID and mapped address columns are used, so skip parsing the rest
+            chunks = pd.read_csv(
+                csv_path,
+                chunksize=chunk_size,
+                low_memory=False,
+                usecols=lambda column: column == uid_field or column in ADDRESS_FIELD_MAPPING,
+            )
 
             with tqdm(total=total_rows, desc="Processing", unit="rows") as pbar:
                 for chunk in chunks:
@@ -16,19 +16,25 @@ import os.path
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-import re
 from pathlib import Path
 
 import torch
 from pymongo import UpdateOne
 from tqdm import tqdm
 from transformers import T5Tokenizer, T5ForConditionalGeneration
-from dateutil.relativedelta import relativedelta
 from dotenv import load_dotenv
 
 from src.utils.mongo_client import MongoDBClient
 from src.utils.lease_term_validator import is_lease_term_valid
-from src.utils.regex_extractors import normalise_term_str
+from src.utils.regex_extractors import SPECIAL_DAY_DATES, normalise_term_str, parse_dol_date
+from src.utils.date_utils import add_months, whole_months_between, whole_years
+from src.utils.t5_extractor import (
+    SPECIAL_DAYS,
+    PATTERN_YEAR,
+    PATTERN_T5_DATE,
+    PATTERN_T5_SPECIAL_DAY,
+    PATTERN_TENURE,
+)
 
 # Load environment variables
 load_dotenv()
@@ -53,7 +59,6 @@ T5_BATCH_SIZE = 32  # Number of records to process in single T5 forward pass
 DB_BATCH_SIZE = 500  # Number of updates to accumulate before bulk write
 MAX_LENGTH = 64  # Max token length for T5
 
-
 class BatchT5Extractor:
     """
     Batch-optimized T5 extractor for lease terms.
@@ -102,7 +107,7 @@ class BatchT5Extractor:
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
         # Generate outputs in batch
-        with torch.no_grad():
+        with torch.inference_mode():
             output_ids = self.model.generate(
                 inputs['input_ids'],
                 attention_mask=inputs['attention_mask'],
@@ -143,7 +148,7 @@ class BatchT5Extractor:
             if parsed['start_date'] is None and dol:
                 parsed['start_date'] = self._parse_dol_date(dol)
                 if parsed['start_date'] and parsed['tenure_years'] and not parsed['expiry_date']:
-                    parsed['expiry_date'] = parsed['start_date'] + relativedelta(years=parsed['tenure_years'])
+                    parsed['expiry_date'] = add_months(parsed['start_date'], parsed['tenure_years'] * 12)
 
             # Check if we have enough data to be valid
             has_valid_data = (
@@ -192,9 +197,9 @@ class BatchT5Extractor:
 
         output = output.strip()
 
-        # Try to find date patterns (DD/MM/YYYY)
-        date_pattern = r'\d{2}/\d{2}/\d{4}'
-        dates = re.findall(date_pattern, output)
+        # Find date patterns (DD/MM/YYYY); the split puts them at the odd positions
+        parts = PATTERN_T5_DATE.split(output)
+        dates = parts[1::2]
 
         start_date = None
         expiry_date = None
@@ -206,7 +211,7 @@ class BatchT5Extractor:
             expiry_date = self._parse_date(dates[1])
 
         # Extract tenure from the remaining text
-        remaining = re.sub(date_pattern, '', output)
+        remaining = ''.join(parts[0::2])
         remaining = remaining.replace('Not specified', '').strip()
 
         if remaining:
@@ -217,29 +222,20 @@ class BatchT5Extractor:
             tenure_years = self._parse_tenure(output)
 
             # Check for special day + year patterns
-            special_match = re.search(r'(Christmas|Midsummer|Lady|Michaelmas)(?:\s+Day)?\s+(\d{4})', output, re.IGNORECASE)
+            special_match = PATTERN_T5_SPECIAL_DAY.search(output)
             if special_match:
-                day_name = special_match.group(1).lower()
-                year = int(special_match.group(2))
-                special_days = {
-                    'christmas': (12, 25),
-                    'midsummer': (6, 24),
-                    'lady': (3, 25),
-                    'michaelmas': (9, 29),
-                }
-                if day_name in special_days:
-                    month, day = special_days[day_name]
-                    start_date = datetime(year, month, day)
+                month, day = SPECIAL_DAY_DATES[special_match.group(1).lower()]
+                start_date = datetime(int(special_match.group(2)), month, day)
 
         # If we have start_date and tenure but no expiry, calculate expiry
         if start_date and tenure_years and not expiry_date:
-            expiry_date = start_date + relativedelta(years=tenure_years)
+            expiry_date = add_months(start_date, tenure_years * 12)
 
         # If we have start and expiry but no tenure, calculate tenure
         if start_date and expiry_date and not tenure_years:
-            delta = relativedelta(expiry_date, start_date)
-            tenure_years = delta.years
-            if delta.months >= 6:
+            months = whole_months_between(start_date, expiry_date)
+            tenure_years = whole_years(months)
+            if months - tenure_years * 12 >= 6:
                 tenure_years += 1
 
         return {
@@ -255,24 +251,15 @@ class BatchT5Extractor:
 
         date_str = date_str.strip()
 
-        for fmt in ["%d/%m/%Y", "%d.%m.%Y", "%d-%m-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        parsed = parse_dol_date(date_str)
+        if parsed is not None:
+            return parsed
 
         # Handle special day names
-        special_days = {
-            'christmas': (12, 25),
-            'midsummer': (6, 24),
-            'lady day': (3, 25),
-            'michaelmas': (9, 29),
-        }
-
         date_str_lower = date_str.lower()
-        for day_name, (month, day) in special_days.items():
+        for day_name, (month, day) in SPECIAL_DAYS:
             if day_name in date_str_lower:
-                year_match = re.search(r'\d{4}', date_str)
+                year_match = PATTERN_YEAR.search(date_str)
                 if year_match:
                     return datetime(int(year_match.group()), month, day)
 
@@ -283,7 +270,7 @@ class BatchT5Extractor:
         if not tenure_str or tenure_str.lower() in ('not specified', 'residential', ''):
             return None
 
-        match = re.search(r'(\d+)\s*years?', tenure_str, re.IGNORECASE)
+        match = PATTERN_TENURE.search(tenure_str)
         if match:
             return int(match.group(1))
 
@@ -291,16 +278,7 @@ class BatchT5Extractor:
 
     def _parse_dol_date(self, dol: str) -> Optional[datetime]:
         """Parse a date of lease (dol) string into a datetime object."""
-        if not dol:
-            return None
-
-        dol = dol.strip()
-        for fmt in ["%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y"]:
-            try:
-                return datetime.strptime(dol, fmt)
-            except ValueError:
-                continue
-        return None
+        return parse_dol_date(dol)
 
 
 def initialize_t5_extractor(model_path: Optional[str] = None) -> BatchT5Extractor:
@@ -0,0 +1,44 @@
+"""
+Calendar-month arithmetic shared by the lease term extractors and validator.
+"""
+
+import calendar
+from datetime import datetime
+
+
+def add_months(date: datetime, months: int) -> datetime:
+    """
+    Add (or subtract) whole months using integer arithmetic.
+
+    The day is clamped to the last day of the target month, so 29 February
+    plus one year gives 28 February (same behaviour as relativedelta).
+    """
+    year, month_index = divmod(date.year * 12 + date.month - 1 + months, 12)
+    month = month_index + 1
+    day = date.day
+    # Every month has a 28th, so only later days need the month length
+    if day > 28:
+        day = min(day, calendar.monthrange(year, month)[1])
+    return date.replace(year=year, month=month, day=day)
+
+
+def whole_months_between(start_date: datetime, end_date: datetime) -> int:
+    """
+    Count the whole months from start_date to end_date, truncated towards zero.
+
+    Months are stepped with add_months, so this is relativedelta(end_date, start_date)
+    expressed in months alone.
+    """
+    months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month
+    if end_date >= start_date:
+        while add_months(start_date, months) > end_date:
+            months -= 1
+    else:
+        while add_months(start_date, months) < end_date:
+            months += 1
+    return months
+
+
+def whole_years(months: int) -> int:
+    """Whole years in a month count, truncated towards zero."""
+    return months // 12 if months >= 0 else -(-months // 12)
@@ -6,9 +6,10 @@ the extracted lease data is logically consistent and valid.
 """
 
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 from typing import Dict, Any, List, Optional
 
+from src.utils.date_utils import add_months
+
 
 class LeaseTermValidationError:
     """Represents a validation error with code and message."""
@@ -133,7 +134,7 @@ def validate_lease_term(
 
     # Validate start_date + tenure_years approximately equals expiry_date
     if tenure_years > 0:
-        calculated_expiry = start_date + relativedelta(years=int(tenure_years))
+        calculated_expiry = add_months(start_date, int(tenure_years) * 12)
         date_diff = abs((calculated_expiry - expiry_date).days)
 
         if date_diff > tolerance_days:
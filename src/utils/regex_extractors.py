@@ -4,22 +4,43 @@ Regex-based extractors for lease term parsing.
 Extracts lease start date, end date, and tenure from various string formats.
 """
 
+import calendar
 import re
+import unicodedata
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-from typing import Optional, Dict, Any
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from typing import Optional, NamedTuple
+
+from src.utils.date_utils import add_months, whole_months_between, whole_years
+
+try:
+    import re2  # google-re2: linear-time DFA engine, used when installed
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # Intel Hyperscan: single-pass multi-pattern scan, used when installed
+except ImportError:
+    hyperscan = None
 
 
 # ============================================================================
 # COMMON REGEX BUILDING BLOCKS (for maintainability and reuse)
 # ============================================================================
 
-# Word numbers commonly used in lease terms (up to 100)
-WORD_NUMBERS = (
-    r'one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|thirteen|'
-    r'fourteen|fifteen|sixteen|seventeen|eighteen|nineteen|twenty|thirty|forty|'
-    r'fifty|sixty|seventy|eighty|ninety|hundred'
-)
+# Word numbers commonly used in lease terms (up to 100) and their values
+WORD_NUMBER_VALUES = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
+    'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18,
+    'nineteen': 19, 'twenty': 20, 'thirty': 30, 'forty': 40,
+    'fifty': 50, 'sixty': 60, 'seventy': 70, 'eighty': 80,
+    'ninety': 90, 'hundred': 100
+}
+WORD_NUMBERS = '|'.join(WORD_NUMBER_VALUES)
 
 # Number pattern: digits (with optional comma for thousands) or word numbers
 # Matches: "99", "999~", "10,000", "one", "twenty"
@@ -35,14 +56,29 @@ FRACTIONAL_NUM = rf'(\d{{1,4}}(?:\s+\d+/\d+)?|\d{{1,4}}\s+and\s+(?:a\s+)?(?:half
 # Date components
 DATE_SEP = r'[./\s]+'  # Date separator: space, period, or slash
 DAY = r'(\d{1,2})'     # Day: 1-2 digits
-MONTH = r'([A-Za-z]+|\d{1,2})'  # Month: name or numeric
+MONTH = r'([a-z]+|\d{1,2})'  # Month: name or numeric
 YEAR = r'(\d{4})'      # Year: 4 digits
 
 # Full date pattern: DD sep Month sep YYYY (3 capture groups)
 DATE_PATTERN = rf'{DAY}{DATE_SEP}{MONTH}{DATE_SEP}{YEAR}'
 
 # Special day names with optional "Day" suffix
-SPECIAL_DAYS = r'(Christmas(?:\s+Day)?|Midsummer(?:\s+Day)?|Lady\s+Day|Michaelmas(?:\s+Day)?)'
+SPECIAL_DAYS = r'(christmas(?:\s+day)?|midsummer(?:\s+day)?|lady\s+day|michaelmas(?:\s+day)?)'
+
+# Month name or abbreviation (lowercase) -> month number, as accepted by strptime's %B / %b
+MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+MONTH_NUMBERS.update({abbr.lower(): number for number, abbr in enumerate(calendar.month_abbr) if abbr})
+# ...and the one or two digit numbers accepted by %m
+MONTH_NUMBERS.update({str(number): number for number in range(1, 13)})
+MONTH_NUMBERS.update({f'{number:02d}': number for number in range(1, 10)})
+
+# Special day name (lowercase, without "day") -> (month, day)
+SPECIAL_DAY_DATES = {
+    'christmas': (12, 25),
+    'midsummer': (6, 24),   # Traditional Midsummer Day in England
+    'lady': (3, 25),        # Lady Day - Feast of the Annunciation
+    'michaelmas': (9, 29),  # Feast of St. Michael
+}
 
 # Date or Special Day pattern - alternative matching
 DATE_OR_SPECIAL = rf'(?:{DATE_PATTERN}|{SPECIAL_DAYS}\s+{YEAR})'
@@ -101,7 +137,45 @@ FOR_TERM = r'(?:for\s+(?:a\s+)?term\s+(?:of\s+)?)?'
 # Years word with optional 's'
 YEARS_WORD = r'years?'
 
+# Fast reject: every supported format contains a digit (date or tenure) or a word number,
+# so anything without one can skip the full pattern battery
+PATTERN_FAST_REJECT = re.compile(rf'\d|{WORD_NUMBERS}', re.IGNORECASE)
+
+# Without a date of lease every pattern needs a date, and normalisation never creates the
+# digits of one, so a raw term with no digit at all cannot match
+PATTERN_DIGIT = re.compile(r'\d')
+
+# Everything but digits, stripped from tenures like "~999" or "1,000"
+PATTERN_NON_DIGIT = re.compile(r'\D')
+
+# Date of lease as accepted by strptime with "%d-%m-%Y", "%d/%m/%Y" or "%d.%m.%Y"
+# (same day/month/year sub-patterns, one separator used throughout)
+PATTERN_DOL_DATE = re.compile(r'(3[01]|[12]\d|0[1-9]|[1-9])([-/.])(1[0-2]|0[1-9]|[1-9])\2(\d\d\d\d)')
+
+if re2 is not None:
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+
+def _compile(pattern: str):
+    """
+    Compile a lease term pattern.
+
+    Lease term patterns are written in lowercase and matched against the lowercased
+    normalised term, so they need no case-insensitive matching.
 
+    Uses RE2 when google-re2 is installed, so matching time stays linear in the
+    input length on long batch runs. Patterns RE2 cannot handle fall back to re.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, _RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=65536)
 def parse_date(day: str, month: str, year: str) -> Optional[datetime]:
     """
     Parse date components into a datetime object.
@@ -114,15 +188,15 @@ def parse_date(day: str, month: str, year: str) -> Optional[datetime]:
     Returns:
         datetime object or None if parsing fails
     """
-    date_str = f"{day} {month} {year}"
-    for fmt in ["%d %B %Y", "%d %b %Y"]:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    # Try numeric month (e.g., 29.9.1909)
+    # Same rules as strptime("%d %B %Y" / "%d %b %Y" / "%d/%m/%Y"), without its format parsing
+    month_num = MONTH_NUMBERS.get(month.lower())
+
+    if not (month_num and day.isascii() and day.isdigit() and len(day) <= 2
+            and year.isdecimal() and len(year) == 4):
+        return None
+
     try:
-        return datetime.strptime(f"{day}/{month}/{year}", "%d/%m/%Y")
+        return datetime(int(year), month_num, int(day))
     except ValueError:
         return None
 
@@ -141,6 +215,7 @@ def parse_month_year_date(month: str, year: str) -> Optional[datetime]:
     return parse_date("1", month, year)
 
 
+@lru_cache(maxsize=65536)
 def parse_dol_date(dol: str) -> Optional[datetime]:
     """
     Parse a date of lease (dol) string into a datetime object.
@@ -156,13 +231,15 @@ def parse_dol_date(dol: str) -> Optional[datetime]:
     if not dol:
         return None
 
-    dol = dol.strip()
-    for fmt in ["%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y"]:
-        try:
-            return datetime.strptime(dol, fmt)
-        except ValueError:
-            continue
-    return None
+    match = PATTERN_DOL_DATE.fullmatch(dol.strip())
+    if not match:
+        return None
+
+    day, month, year = match.group(1, 3, 4)
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
 
 
 def parse_word_number(word: str) -> Optional[int]:
@@ -175,27 +252,29 @@ def parse_word_number(word: str) -> Optional[int]:
     Returns:
         Integer value or None if parsing fails
     """
-    word_to_num = {
-        'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-        'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-        'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
-        'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18,
-        'nineteen': 19, 'twenty': 20, 'thirty': 30, 'forty': 40,
-        'fifty': 50, 'sixty': 60, 'seventy': 70, 'eighty': 80,
-        'ninety': 90, 'hundred': 100
-    }
-
-    word_lower = word.lower().strip()
+    # Plain digit strings are the common case
+    if word.isdecimal():
+        return int(word)
 
     # Check if it's a digit string (possibly with ~, commas, or other chars)
-    digits = re.sub(r'[^\d]', '', word)
+    digits = PATTERN_NON_DIGIT.sub('', word)
     if digits:
         return int(digits)
 
     # Check word map
-    return word_to_num.get(word_lower)
+    return WORD_NUMBER_VALUES.get(word.lower().strip())
+
+
+# Words after "X and" in fractional tenures ("65 and half", "52 and a quarter")
+FRACTION_WORDS = {
+    'half': 0.5,
+    'a half': 0.5,
+    'quarter': 0.25,
+    'a quarter': 0.25,
+}
 
 
+@lru_cache(maxsize=1024)
 def parse_fractional_years(years_str: str) -> Optional[float]:
     """
     Parse years string that may contain fractions.
@@ -218,26 +297,29 @@ def parse_fractional_years(years_str: str) -> Optional[float]:
         return None
 
     years_str = years_str.strip().lower()
+    parts = years_str.split()
 
-    # Handle "X and [a] half/quarter"
-    match = re.match(r'^(\d+)\s+and\s+(?:a\s+)?(half|quarter)$', years_str, re.IGNORECASE)
-    if match:
-        base = int(match.group(1))
-        fraction = match.group(2).lower()
-        return base + (0.5 if fraction == 'half' else 0.25)
+    if len(parts) > 1 and parts[0].isdecimal():
+        base = int(parts[0])
 
-    # Handle "X Y/Z" format (e.g., "97 3/4")
-    match = re.match(r'^(\d+)\s+(\d+)/(\d+)$', years_str)
-    if match:
-        base, num, denom = int(match.group(1)), int(match.group(2)), int(match.group(3))
-        if denom != 0:
-            return base + (num / denom)
+        # Handle "X and [a] half/quarter"
+        if parts[1] == 'and':
+            fraction = FRACTION_WORDS.get(' '.join(parts[2:]))
+            if fraction is not None:
+                return base + fraction
+
+        # Handle "X Y/Z" format (e.g., "97 3/4")
+        elif len(parts) == 2:
+            num, slash, denom = parts[1].partition('/')
+            if slash and num.isdecimal() and denom.isdecimal() and int(denom) != 0:
+                return base + (int(num) / int(denom))
 
     # Handle plain numbers (including word numbers)
     num = parse_word_number(years_str)
     return float(num) if num is not None else None
 
 
+@lru_cache(maxsize=1024)
 def resolve_special_day(day_name: str, year: str) -> Optional[datetime]:
     """
     Resolve special day names like Christmas Day and Midsummer Day to actual dates.
@@ -252,25 +334,17 @@ def resolve_special_day(day_name: str, year: str) -> Optional[datetime]:
     if not day_name or not year:
         return None
 
+    # Normalize and lookup - handles both "Christmas" and "Christmas Day"
+    month_day = SPECIAL_DAY_DATES.get(day_name.lower().strip().replace(' day', ''))
+    if month_day is None:
+        return None
+
     try:
         year_int = int(year)
     except ValueError:
         return None
 
-    # Normalize and lookup - handles both "Christmas" and "Christmas Day"
-    day_name_lower = day_name.lower().strip().replace(' day', '')
-    special_days = {
-        'christmas': (12, 25),
-        'midsummer': (6, 24),  # Traditional Midsummer Day in England
-        'lady': (3, 25),      # Lady Day - Feast of the Annunciation
-        'michaelmas': (9, 29), # Feast of St. Michael
-    }
-
-    if day_name_lower in special_days:
-        month, day = special_days[day_name_lower]
-        return datetime(year_int, month, day)
-
-    return None
+    return datetime(year_int, *month_day)
 
 
 def _parse_date_or_special(groups: tuple, start_idx: int = 0) -> Optional[datetime]:
@@ -312,40 +386,56 @@ def _calculate_tenure_years(start_date: datetime, expiry_date: datetime) -> int:
     Returns:
         Integer tenure in years, rounded up when close to year boundary
     """
-    delta = relativedelta(expiry_date, start_date)
-    years = delta.years
+    months = whole_months_between(start_date, expiry_date)
+    years = whole_years(months)
 
-    # If there are remaining months (11+) and days that bring us close to another year,
-    # or if we're just a few days short of the next year, round up
-    if delta.months == 11 and delta.days >= 1:
-        # 11 months and some days -> round up
+    # 11 months and some days -> round up
+    if months >= 0 and months % 12 == 11 and (expiry_date - add_months(start_date, months)).days >= 1:
         years += 1
-    elif delta.months == 0 and delta.days < 0:
-        # This shouldn't happen with relativedelta but handle edge case
-        pass
-    elif delta.months >= 6:
-        # More than half a year remaining, could round up but be conservative
-        # Only round up if very close (11 months+)
-        pass
 
     # Also check: if adding 30 days to expiry would cross a year boundary from start
     # This handles cases like "May 3 to May 2" (one day short)
-    adjusted_expiry = expiry_date + timedelta(days=30)
-    adjusted_delta = relativedelta(adjusted_expiry, start_date)
-    if adjusted_delta.years > years:
-        years = adjusted_delta.years
+    adjusted_years = whole_years(whole_months_between(start_date, expiry_date + timedelta(days=30)))
+    if adjusted_years > years:
+        years = adjusted_years
 
     return years
 
 
-def _build_result(start_date: datetime, expiry_date: datetime, tenure_years) -> Dict[str, Any]:
-    """Build the standard result dictionary."""
-    return {
-        'start_date': start_date,
-        'expiry_date': expiry_date,
-        'tenure_years': tenure_years,
-        'extractor': 'regex'
-    }
+class LeaseTerm(NamedTuple):
+    """
+    Parsed lease term.
+
+    A fixed-size tuple rather than a dict, so it is cheap to build and pickle
+    across worker processes. String-key lookups ('start_date' in term,
+    term['start_date'], term.get(...), dict(term)) still work for callers
+    written against the old dictionary result.
+    """
+    start_date: datetime
+    expiry_date: datetime
+    tenure_years: float
+    extractor: str = 'regex'
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+
+def _build_result(start_date: datetime, expiry_date: datetime, tenure_years) -> LeaseTerm:
+    """Build the standard result."""
+    return LeaseTerm(start_date, expiry_date, tenure_years)
 
 
 def _calculate_expiry(start_date: datetime, years: float, less_days: int = 1,
@@ -353,13 +443,775 @@ def _calculate_expiry(start_date: datetime, years: float, less_days: int = 1,
     """Calculate expiry date from start date and tenure adjustments."""
     full_years = int(years)
     fractional_months = int(round((years - full_years) * 12))
-    expiry = start_date + relativedelta(years=full_years, months=fractional_months + plus_months)
-    expiry = expiry - timedelta(days=less_days) + timedelta(days=plus_days)
-    expiry = expiry - relativedelta(months=less_months)
+    expiry = add_months(start_date, full_years * 12 + fractional_months + plus_months)
+    expiry = expiry + timedelta(days=plus_days - less_days)
+    if less_months:
+        expiry = add_months(expiry, -less_months)
     return expiry
 
 
-def parse_lease_term(term_str: str, dol: Optional[str] = None) -> Optional[Dict[str, Any]]:
+# ============================================================================
+# LEASE TERM PATTERNS (compiled once at import, tried in this order)
+# ============================================================================
+
+# Pattern 1: Years with both start AND end dates explicitly stated
+PATTERN_YEARS_START_END = _compile(
+    rf'{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}{OPT_INCLUSIVE}\s*'
+    rf'{END_PHRASE}{DATE_PATTERN}{OPT_INCLUSIVE}'
+)
+
+# Pattern 2a: With start keyword (from/beginning/commencing/starting)
+PATTERN_DATE_RANGE = _compile(
+    rf'(?:{TERM_PREFIX})?{START_PHRASE}{OPT_THE}{DATE_PATTERN}\s*[,]?\s*'
+    rf'{END_PHRASE}{DATE_PATTERN}{OPT_INCLUSIVE}'
+)
+
+# Pattern 2b: "DD Month YYYY to/until/expiring DD Month YYYY" (no start keyword)
+PATTERN_DATE_TO_DATE = _compile(
+    rf'^{DATE_PATTERN}\s+(?:to|until|expiring\s+{OPT_ON}{OPT_INCLUDING})\s*{DATE_PATTERN}'
+)
+
+# Pattern 2c: "Expiring on DATE from DATE" (expiry date first, then start date)
+PATTERN_EXPIRING_FROM = _compile(
+    rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 2d: "From DD Month YYYY for a term [of years] expiring on DD Month YYYY"
+PATTERN_FOR_TERM_EXPIRING = _compile(
+    rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'{FOR_TERM}{YEARS_WORD}?\s*expiring\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 2e: "From [and including] DATE and expiring on the expiration of X years from DATE"
+PATTERN_EXPIRING_ON_EXPIRATION_OF = _compile(
+    rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'and\s+expiring\s+on\s+the\s+expiration\s+of\s+{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'from\s+{DATE_PATTERN}'
+)
+
+# Pattern 3a: Years with optional less/plus days modifier and date/special day
+PATTERN_YEARS_WITH_MODIFIERS = _compile(
+    rf'^{TERM_PREFIX}{FRACTIONAL_NUM}\s*{YEARS_WORD}'
+    rf'(?:{LESS_DAYS}|{PLUS_DAYS}|{LESS_MONTHS})?'
+    rf'\s+{START_PHRASE}{OPT_THE}'
+    rf'(?:{DATE_PATTERN}|{SPECIAL_DAYS}\s+{YEAR})'
+)
+
+# Pattern 3b: "From ... for [the] term [of] X years [less [the] [last] N days]"
+PATTERN_FROM_FOR_TERM = _compile(
+    rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'for\s+(?:the\s+)?term\s+(?:of\s+)?{NUM_CAP}\s*{YEARS_WORD}'
+    rf'(?:\s+less\s+(?:the\s+)?(?:last\s+)?{NUM_CAP}\s+days?)?'
+)
+
+# Pattern 3c: Years with "and X months" modifier
+PATTERN_YEARS_AND_MONTHS = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s*'
+    rf'(?:and\s+)?{NUM_CAP}\s+months?\s*'
+    rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}'
+    rf'{LESS_DAYS}'
+)
+
+# Pattern 4a: Standard "X years from/commencing/beginning DATE/SPECIAL_DAY"
+PATTERN_YEARS_FROM_DATE = _compile(
+    rf'^(?:from\s+{OPT_INCLUDING})?{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'{START_PHRASE}{OPT_THE}'
+    rf'(?:{DATE_PATTERN}|{SPECIAL_DAYS}\s+{YEAR})'
+)
+
+# Pattern 4b: "[commencing|beginning] on DATE for [a term of] X years"
+PATTERN_COMMENCING_FOR_TERM = _compile(
+    rf'(?:commencing|beginning|starting)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'{FOR_TERM}{NUM_CAP}\s*{YEARS_WORD}'
+)
+
+# Pattern 4c: "from [and including] DATE for [a term of] X years"
+PATTERN_FROM_FOR_YEARS = _compile(
+    rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
+    rf'for\s+(?:a\s+term\s+(?:of\s+)?)?{NUM_CAP}\s*{YEARS_WORD}'
+)
+
+# Pattern 4d: "X years expiring/to [and including] DATE" (expiry-based, calculate start)
+PATTERN_YEARS_EXPIRING = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'(?:expiring|to)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 4e: "starts/commencing DATE and expiring X years thereafter"
+PATTERN_DATE_YEARS_THEREAFTER = _compile(
+    rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}\s+'
+    rf'and\s+(?:expiring|expiry)\s+{NUM_CAP}\s*{YEARS_WORD}\s+thereafter'
+)
+
+# Pattern 4f: "X years from [and including] Month YYYY" (no day, defaults to 1st)
+PATTERN_YEARS_FROM_MONTH_YEAR = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'(?:from|commencing|beginning|starting)(?:\s+(?:on|from))?\s*(?:and\s+including\s+)?'
+    rf'([a-z]+)\s+(\d{{4}})(?:\s*$|\s)'
+)
+
+# Pattern 5a: "X years DD Month YYYY" (missing 'from')
+PATTERN_YEARS_DATE_NO_FROM = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+{DATE_PATTERN}'
+)
+
+# Pattern 5b: "X from DD Month YYYY" (missing "years")
+PATTERN_NUM_FROM_DATE = _compile(
+    rf'^(\d{{1,4}})\s+from\s+{OPT_THE}{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 5c: "X less N days from DATE" or "X and N day(s) from DATE" (missing "years")
+PATTERN_NUM_MODIFIER_FROM_DATE = _compile(
+    rf'^(\d{{1,6}})\s+(?:(less|and)\s+({NUM})\s+days?)\s+'
+    rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}'
+)
+
+# Pattern 6a: "X years from [the] date [of] [this] [the] lease"
+PATTERN_YEARS_FROM_DOL = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'(?:{START_KW}(?:\s+on)?)\s+{OPT_THE}date\s+(?:of\s+)?(?:this\s+)?{OPT_THE}lease'
+)
+
+# Pattern 6b-1: Handle "the Nth day of Month Year" format specifically
+PATTERN_TERM_EXPIRING_DAY_OF = _compile(
+    rf'^(?:for\s+)?(?:a\s+)?(?:term|number)(?:\s+of)?(?:\s+years?)?\s+'
+    rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{OPT_THE}(\d{{1,2}})\s+day\s+of\s+([a-z]+)\s+(\d{{4}})'
+)
+
+# Pattern 6b-2: Standard format without "day of"
+PATTERN_TERM_EXPIRING = _compile(
+    rf'^(?:for\s+)?(?:a\s+)?(?:term|number)(?:\s+of)?(?:\s+years?)?\s+'
+    rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 6c: "expiring on DD Month YYYY" (just expiry, no term prefix)
+PATTERN_EXPIRING_ONLY = _compile(
+    rf'^(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}$'
+)
+
+# Pattern 6d: "X years [less N days]" or "X (less N days)" (just tenure, optional modifier, start from dol)
+PATTERN_YEARS_ONLY = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}?'
+    rf'(?:\s*\(?\s*less\s+{NUM_CAP}\s+days?\s*\)?)?$'
+)
+
+# Pattern 6d-2: "NNN (less N days)" - specific pattern for number with parenthetical less days
+PATTERN_NUM_PAREN_LESS = _compile(
+    rf'^(\d{{1,4}})\s*\(\s*less\s+(\d+)\s+days?\s*\)$'
+)
+
+# Pattern 6e: "X years from/commencing/beginning [and including]" (incomplete, uses dol)
+PATTERN_YEARS_FROM_INCOMPLETE = _compile(
+    rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
+    rf'(?:from|commencing|beginning|starting)(?:\s+(?:on|from))?(?:\s+and\s+including)?$'
+)
+
+# Pattern 6f: "beginning on [, and including] [the] date of this lease and ending on [,] DD Month YYYY"
+PATTERN_BEGINNING_DOL_ENDING = _compile(
+    rf'beginning\s+on[,]?\s*{OPT_INCLUDING}{OPT_THE}date\s+of\s+(?:this\s+)?(?:the\s+)?lease\s+'
+    rf'{END_PHRASE}{DATE_PATTERN}'
+)
+
+# Pattern 6f-2: "from [and including] [the] date [of] [the] lease [up to / and expiring on] DATE"
+PATTERN_FROM_DOL_TO_DATE = _compile(
+    rf'from\s+{OPT_INCLUDING}{OPT_THE}date\s+(?:of\s+)?(?:this\s+)?{OPT_THE}lease\s+'
+    rf'(?:up\s+to|{END_PHRASE})\s*{DATE_PATTERN}'
+)
+
+# Pattern 6g: "From [and including] DD Month to [and including] DD Month YYYY"
+PATTERN_FROM_MONTH_TO_MONTH_YEAR = _compile(
+    rf'from\s+{OPT_INCLUDING}(\d{{1,2}})\s+([a-z]+)\s+'
+    rf'to\s+{OPT_INCLUDING}{DATE_PATTERN}'
+)
+
+# Pattern 6h: Single date as expiry date (e.g., "18 April 1997")
+PATTERN_SINGLE_DATE = _compile(
+    rf'^{DATE_PATTERN}$'
+)
+
+
+# Every lease term pattern, in the order parse_lease_term tries them
+LEASE_TERM_PATTERNS = (
+    PATTERN_YEARS_START_END,
+    PATTERN_DATE_RANGE,
+    PATTERN_DATE_TO_DATE,
+    PATTERN_EXPIRING_FROM,
+    PATTERN_FOR_TERM_EXPIRING,
+    PATTERN_EXPIRING_ON_EXPIRATION_OF,
+    PATTERN_YEARS_WITH_MODIFIERS,
+    PATTERN_FROM_FOR_TERM,
+    PATTERN_YEARS_AND_MONTHS,
+    PATTERN_YEARS_FROM_DATE,
+    PATTERN_COMMENCING_FOR_TERM,
+    PATTERN_FROM_FOR_YEARS,
+    PATTERN_YEARS_EXPIRING,
+    PATTERN_DATE_YEARS_THEREAFTER,
+    PATTERN_YEARS_FROM_MONTH_YEAR,
+    PATTERN_YEARS_DATE_NO_FROM,
+    PATTERN_NUM_FROM_DATE,
+    PATTERN_NUM_MODIFIER_FROM_DATE,
+    PATTERN_YEARS_FROM_DOL,
+    PATTERN_TERM_EXPIRING_DAY_OF,
+    PATTERN_TERM_EXPIRING,
+    PATTERN_EXPIRING_ONLY,
+    PATTERN_YEARS_ONLY,
+    PATTERN_NUM_PAREN_LESS,
+    PATTERN_YEARS_FROM_INCOMPLETE,
+    PATTERN_BEGINNING_DOL_ENDING,
+    PATTERN_FROM_DOL_TO_DATE,
+    PATTERN_FROM_MONTH_TO_MONTH_YEAR,
+    PATTERN_SINGLE_DATE,
+)
+
+# Word that every match of a pattern contains, checked with a substring test to
+# rule patterns out when Hyperscan is not installed. Patterns with no single such word are
+# always searched
+PATTERN_KEYWORDS = {
+    PATTERN_YEARS_START_END: 'year',
+    PATTERN_EXPIRING_FROM: 'from',
+    PATTERN_FOR_TERM_EXPIRING: 'expiring',
+    PATTERN_EXPIRING_ON_EXPIRATION_OF: 'expiration',
+    PATTERN_YEARS_WITH_MODIFIERS: 'year',
+    PATTERN_FROM_FOR_TERM: 'term',
+    PATTERN_YEARS_AND_MONTHS: 'month',
+    PATTERN_YEARS_FROM_DATE: 'year',
+    PATTERN_COMMENCING_FOR_TERM: 'year',
+    PATTERN_FROM_FOR_YEARS: 'for',
+    PATTERN_YEARS_EXPIRING: 'year',
+    PATTERN_DATE_YEARS_THEREAFTER: 'thereafter',
+    PATTERN_YEARS_FROM_MONTH_YEAR: 'year',
+    PATTERN_YEARS_DATE_NO_FROM: 'year',
+    PATTERN_NUM_FROM_DATE: 'from',
+    PATTERN_NUM_MODIFIER_FROM_DATE: 'day',
+    PATTERN_YEARS_FROM_DOL: 'lease',
+    PATTERN_TERM_EXPIRING_DAY_OF: 'day',
+    PATTERN_NUM_PAREN_LESS: 'less',
+    PATTERN_BEGINNING_DOL_ENDING: 'lease',
+    PATTERN_FROM_DOL_TO_DATE: 'lease',
+    PATTERN_FROM_MONTH_TO_MONTH_YEAR: 'from',
+}
+
+# Parenthetical text, dropped before the final retry ("99 years (renewable) from ...")
+PATTERN_PARENTHETICAL = re.compile(r'\s*\([^)]*\)')
+
+if hyperscan is not None:
+    # One database holding every pattern, so a single scan reports which of them match.
+    # UTF8 + UCP keep \s, \d and \b consistent with Python's Unicode matching.
+    try:
+        _HS_DATABASE = hyperscan.Database()
+        _HS_DATABASE.compile(
+            expressions=[pattern.pattern.encode() for pattern in LEASE_TERM_PATTERNS],
+            ids=list(range(len(LEASE_TERM_PATTERNS))),
+            elements=len(LEASE_TERM_PATTERNS),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP,
+        )
+        # Scratch space is per process; parse_lease_term is not called from multiple threads
+        _HS_SCRATCH = hyperscan.Scratch(_HS_DATABASE)
+    except hyperscan.error:
+        # A pattern Hyperscan cannot compile; fall back to the keyword prefilter
+        hyperscan = None
+
+
+def _matching_patterns(term_str: str) -> Optional[set]:
+    """
+    Find which LEASE_TERM_PATTERNS match the lowercased term_str in one Hyperscan pass.
+
+    Without Hyperscan, patterns whose PATTERN_KEYWORDS word is missing from the term
+    are ruled out instead, so the set may include patterns that do not match.
+
+    Returns:
+        Set of candidate patterns, or None when every pattern is a candidate
+    """
+    if hyperscan is None:
+        return {pattern for pattern in LEASE_TERM_PATTERNS if PATTERN_KEYWORDS.get(pattern, '') in term_str}
+
+    matched = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        matched.add(LEASE_TERM_PATTERNS[pattern_id])
+
+    try:
+        _HS_DATABASE.scan(term_str.encode(), match_event_handler=on_match, scratch=_HS_SCRATCH)
+    except UnicodeEncodeError:
+        return None
+    return matched
+
+
+# ============================================================================
+# LEASE TERM HANDLERS (one per pattern; None sends parse_lease_term on to the next)
+# ============================================================================
+
+# ----------------------------------------------------------------------------
+# PATTERN 1: Years with both start AND end dates explicitly stated
+# ----------------------------------------------------------------------------
+# Examples:
+#   "10 years from and including 25 August 2020 to and including 24 August 2030"
+#   "215 years beginning on and including 24 June 1986 and ending on and including 23 June 2201"
+#   "189 years commencing on and including 01 September 1995 and expiring on and including 31 August 2184"
+#   "125 years beginning on 1 January 2013 inclusive and ending on 31 December 2138 inclusive"
+#   "22 years commencing on and including 8 November 2023 and ending on 7 November 2045"
+
+def _parse_years_start_end(match) -> Optional[LeaseTerm]:
+    years = parse_word_number(match.group(1))
+    start_date = parse_date(match.group(2), match.group(3), match.group(4))
+    expiry_date = parse_date(match.group(5), match.group(6), match.group(7))
+    if start_date and expiry_date and years:
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# PATTERN 2: Date range without explicit years (tenure calculated)
+# ----------------------------------------------------------------------------
+# Examples:
+#   "From and including 24 June 2020 to and including 23 June 2025"
+#   "Beginning on and including 1 April 1982 and ending on and including 31 March 2197"
+#   "commencing on 28 July 2016 and expiring on 27 July 2115"
+#   "5 June 2002 until 31 December 3001"
+#   "18 December 1987 expiring on 17 December 2176"
+
+def _parse_start_then_expiry(match) -> Optional[LeaseTerm]:
+    """Pattern 2a, 2b and 2d: start date in groups 1-3, expiry date in groups 4-6."""
+    start_date = parse_date(match.group(1), match.group(2), match.group(3))
+    expiry_date = parse_date(match.group(4), match.group(5), match.group(6))
+    if start_date and expiry_date:
+        tenure_years = _calculate_tenure_years(start_date, expiry_date)
+        return _build_result(start_date, expiry_date, tenure_years)
+    return None
+
+
+def _parse_expiring_from(match) -> Optional[LeaseTerm]:
+    """Pattern 2c: "Expiring on 21 October 2115 from 22 October 1990" (expiry date first)."""
+    expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
+    start_date = parse_date(match.group(4), match.group(5), match.group(6))
+    if start_date and expiry_date:
+        tenure_years = _calculate_tenure_years(start_date, expiry_date)
+        return _build_result(start_date, expiry_date, tenure_years)
+    return None
+
+
+def _parse_expiring_on_expiration_of(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 2e: "From [and including] DATE and expiring on the expiration of X years from DATE"
+
+    Example: "From and including 19 June 2012 and expiring on the expiration of 999 years from 15 June 2001"
+    Lease start is the first date, expiry is calculated as second date + X years
+    """
+    start_date = parse_date(match.group(1), match.group(2), match.group(3))
+    years = parse_word_number(match.group(4))
+    base_date = parse_date(match.group(5), match.group(6), match.group(7))
+    if start_date and years and base_date:
+        expiry_date = _calculate_expiry(base_date, years)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# PATTERN 3: Years with modifiers (less/plus days/months, fractional) + start date
+# ----------------------------------------------------------------------------
+# Consolidated pattern handling: fractional years, less/plus days, less months
+# Examples:
+#   "97 3/4 years from 25 March 1866"
+#   "65 and half years from 25 March 1904"
+#   "52 and a quarter years less 10 days from 25 March 1906"
+#   "99 years less 10 days from Midsummer Day 1852"
+#   "67 years (less 3 days) from Midsummer Day 1881"
+#   "215 years (less 3 days) from and including 24 June 1986"
+#   "500 years less 9 months from 29 September 1585"
+#   "999 Years plus 7 days from 01 November 2004"
+#   "999 years and 10 days commencing on and including 10/5/2024"
+#   "250 years less 20 days beginning on 18 October 2016"
+#   "From and including 19 September 1988 for the term of 125 years less the last 5 days"
+
+def _parse_years_with_modifiers(match) -> Optional[LeaseTerm]:
+    """Pattern 3a: Years with optional less/plus days modifier and date/special day."""
+    # Read all groups once rather than calling match.group() per test and per use
+    (years_str, less_days_str, plus_days_str, less_months_str,
+     day, month, year, special_day, special_year) = match.groups()
+    years_float = parse_fractional_years(years_str)
+
+    # Try to extract modifiers - groups vary based on which modifier matched
+    less_days, plus_days, less_months = 0, 0, 0
+    if less_days_str:
+        less_days = parse_word_number(less_days_str) or 0
+    if plus_days_str:
+        plus_days = parse_word_number(plus_days_str) or 0
+    if less_months_str:
+        less_months = parse_word_number(less_months_str) or 0
+
+    # Check for regular date or special day
+    if day:  # Regular date
+        start_date = parse_date(day, month, year)
+    else:  # Special day name
+        start_date = resolve_special_day(special_day, special_year)
+
+    if years_float and start_date:
+        expiry_date = _calculate_expiry(start_date, years_float,
+                                        less_days=less_days,
+                                        plus_days=plus_days,
+                                        less_months=less_months)
+        return _build_result(start_date, expiry_date, years_float)
+    return None
+
+
+def _parse_from_for_term(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 3b: "From ... for [the] term [of] X years [less [the] [last] N days]"
+
+    Example: "From and including 19 September 1988 for the term of 125 years less the last 5 days"
+    """
+    start_date = parse_date(match.group(1), match.group(2), match.group(3))
+    years = parse_word_number(match.group(4))
+    less_days_str = match.group(5)
+    less_days = parse_word_number(less_days_str) if less_days_str else 0
+    if start_date and years:
+        expiry_date = _calculate_expiry(start_date, years, less_days=less_days)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+def _parse_years_and_months(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 3c: Years with "and X months" modifier
+
+    Examples: "31 years and 6 months from 28 March 2024", "20 years and 3 months from and including 9 September 2015"
+              "980 years 6 months from 25 March 1923" (without "and")
+    """
+    years = parse_word_number(match.group(1))
+    months = parse_word_number(match.group(2))
+    start_date = parse_date(match.group(3), match.group(4), match.group(5))
+    if years and start_date and months is not None:
+        expiry_date = add_months(start_date, years * 12 + months)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# PATTERN 4: Simple years + start date (no modifiers)
+# ----------------------------------------------------------------------------
+# Consolidated patterns for: X years from/commencing/beginning DATE
+# Examples:
+#   "99 years from 24 June 1862"
+#   "999 years from the 22 December 1953"
+#   "20 years from 28/06/1996"
+#   "99 years on and from 1 June 2016"
+#   "215 years beginning on and including 24 June 1988"
+#   "Ten years beginning on and including 6 December 2016" (word number)
+#   "125 years from and including the 01 March 2023"
+#   "99 years from Christmas Day 1900" (special day)
+#   "From and including 90 years from 2 December 2024" (weird format)
+
+def _parse_years_from_date(match) -> Optional[LeaseTerm]:
+    """Pattern 4a: Standard "X years from/commencing/beginning DATE/SPECIAL_DAY"."""
+    years_str, day, month, year, special_day, special_year = match.groups()
+    years = parse_word_number(years_str)
+    # Check for regular date or special day
+    if day:
+        start_date = parse_date(day, month, year)
+    else:
+        start_date = resolve_special_day(special_day, special_year)
+    if years and start_date:
+        expiry_date = _calculate_expiry(start_date, years)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+def _parse_date_then_years(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 4b, 4c and 4e: start date in groups 1-3, years in group 4
+
+    Examples: "commencing on 10 may 2013 for a term of 125 years",
+              "from and including 1 October 2002 for 20 years", "From 25 May 1988 for a term of 212 years",
+              "Commences on 28 July 2024 and expires 50 years thereafter"
+    """
+    start_date = parse_date(match.group(1), match.group(2), match.group(3))
+    years = parse_word_number(match.group(4))
+    if start_date and years:
+        expiry_date = _calculate_expiry(start_date, years)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+def _parse_years_expiring(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 4d: "X years expiring/to [and including] DATE" (expiry-based, calculate start)
+
+    Examples: "147 years expiring on 23 June 2161", "15 years to and including 9 December 2039"
+    """
+    years = parse_word_number(match.group(1))
+    expiry_date = parse_date(match.group(2), match.group(3), match.group(4))
+    if years and expiry_date:
+        start_date = add_months(expiry_date, -years * 12)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+def _parse_years_from_month_year(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 4f: "X years from [and including] Month YYYY" (no day, defaults to 1st)
+
+    Example: "999 years from and including December 2023", "125 years from January 2020"
+    """
+    years = parse_word_number(match.group(1))
+    start_date = parse_month_year_date(match.group(2), match.group(3))
+    if years and start_date:
+        expiry_date = _calculate_expiry(start_date, years)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# PATTERN 5: Fallback patterns (missing keywords)
+# ----------------------------------------------------------------------------
+# Examples:
+#   "999 years 25 March 1896" (missing 'from')
+#   "999 from 27 April 2006" (missing "years")
+
+def _parse_years_then_date(match) -> Optional[LeaseTerm]:
+    """Pattern 5a and 5b: "X years DD Month YYYY" (missing 'from') and "X from DD Month YYYY" (missing "years")."""
+    years = parse_word_number(match.group(1))
+    start_date = parse_date(match.group(2), match.group(3), match.group(4))
+    if years and start_date:
+        expiry_date = _calculate_expiry(start_date, years)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+def _parse_num_modifier_from_date(match) -> Optional[LeaseTerm]:
+    """
+    Pattern 5c: "X less N days from DATE" or "X and N day(s) from DATE" (missing "years")
+
+    Examples: "125 less 1 day from 1 May 1989", "999 less ten days from 23 March 1958"
+              "99 less 10 days from 2.4.1986", "999 and 1 day from 28 March 1988"
+    """
+    years_str, modifier, modifier_days_str, day, month, year = match.groups()
+    years = parse_word_number(years_str)
+    modifier_type = modifier.lower() if modifier else None
+    modifier_days = parse_word_number(modifier_days_str) if modifier_days_str else 0
+    start_date = parse_date(day, month, year)
+    if years and start_date:
+        less_days = modifier_days if modifier_type == 'less' else 0
+        plus_days = modifier_days if modifier_type == 'and' else 0
+        expiry_date = _calculate_expiry(start_date, years, less_days=less_days, plus_days=plus_days)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# ----------------------------------------------------------------------------
+# PATTERN 6: Date of Lease (dol) patterns - start date from dol field
+# ----------------------------------------------------------------------------
+# These handlers also take the parsed dol
+
+def _parse_years_from_dol(match, dol_date: datetime) -> Optional[LeaseTerm]:
+    """
+    Pattern 6a: "X years from [the] date [of] [this] [the] lease", 6d: "X years [less N days]"
+    and 6e: "X years from/commencing/beginning [and including]" (incomplete)
+
+    Examples: "999 years from the date of the lease", "150 years commencing on the date of the lease",
+              "999 years less 6 days", "999 years", "125 years from and including", "200 years commencing"
+    Less days are ignored per requirement.
+    """
+    years = parse_word_number(match.group(1))
+    if years:
+        expiry_date = _calculate_expiry(dol_date, years)
+        return _build_result(dol_date, expiry_date, years)
+    return None
+
+
+def _parse_expiry_from_dol(match, dol_date: datetime) -> Optional[LeaseTerm]:
+    """
+    Pattern 6b, 6c, 6f and 6h: only the expiry date is stated (groups 1-3), start from dol
+
+    Examples: "a term of years expiring on 23 June 2237", "A number of years ending on 12 November 2179",
+              "For a term expiring on the 31st day of March 2122", "expiring on 1 March 2032",
+              "beginning on, and including the date of this lease and ending on, 1 March 2032",
+              "from the date of the lease and expiring on 1 February 3003", "18 April 1997"
+    """
+    expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
+    if expiry_date:
+        tenure_years = _calculate_tenure_years(dol_date, expiry_date)
+        return _build_result(dol_date, expiry_date, tenure_years)
+    return None
+
+
+def _parse_num_paren_less(match, dol_date: datetime) -> Optional[LeaseTerm]:
+    """Pattern 6d-2: "999 (less 10 days)" - less days are ignored per requirement."""
+    years = int(match.group(1))
+    if years:
+        expiry_date = _calculate_expiry(dol_date, years)
+        return _build_result(dol_date, expiry_date, years)
+    return None
+
+
+def _parse_from_month_to_month_year(match, dol_date: datetime) -> Optional[LeaseTerm]:
+    """
+    Pattern 6g: "From [and including] DD Month to [and including] DD Month YYYY"
+
+    Example: "From and including 30 September to and including 29 September 2031"
+    Start year comes from dol
+    """
+    start_day, start_month = match.group(1), match.group(2)
+    end_day, end_month, end_year = match.group(3), match.group(4), match.group(5)
+    start_date = parse_date(start_day, start_month, str(dol_date.year))
+    expiry_date = parse_date(end_day, end_month, end_year)
+    if start_date and expiry_date:
+        tenure_years = _calculate_tenure_years(start_date, expiry_date)
+        return _build_result(start_date, expiry_date, tenure_years)
+    return None
+
+
+# (pattern, handler) pairs in the order parse_lease_term tries them; the first
+# handler to return a result wins
+LEASE_TERM_HANDLERS = (
+    (PATTERN_YEARS_START_END, _parse_years_start_end),                      # 1
+    (PATTERN_DATE_RANGE, _parse_start_then_expiry),                         # 2a
+    (PATTERN_DATE_TO_DATE, _parse_start_then_expiry),                       # 2b
+    (PATTERN_EXPIRING_FROM, _parse_expiring_from),                          # 2c
+    (PATTERN_FOR_TERM_EXPIRING, _parse_start_then_expiry),                  # 2d
+    (PATTERN_EXPIRING_ON_EXPIRATION_OF, _parse_expiring_on_expiration_of),  # 2e
+    (PATTERN_YEARS_WITH_MODIFIERS, _parse_years_with_modifiers),            # 3a
+    (PATTERN_FROM_FOR_TERM, _parse_from_for_term),                          # 3b
+    (PATTERN_YEARS_AND_MONTHS, _parse_years_and_months),                    # 3c
+    (PATTERN_YEARS_FROM_DATE, _parse_years_from_date),                      # 4a
+    (PATTERN_COMMENCING_FOR_TERM, _parse_date_then_years),                  # 4b
+    (PATTERN_FROM_FOR_YEARS, _parse_date_then_years),                       # 4c
+    (PATTERN_YEARS_EXPIRING, _parse_years_expiring),                        # 4d
+    (PATTERN_DATE_YEARS_THEREAFTER, _parse_date_then_years),                # 4e
+    (PATTERN_YEARS_FROM_MONTH_YEAR, _parse_years_from_month_year),          # 4f
+    (PATTERN_YEARS_DATE_NO_FROM, _parse_years_then_date),                   # 5a
+    (PATTERN_NUM_FROM_DATE, _parse_years_then_date),                        # 5b
+    (PATTERN_NUM_MODIFIER_FROM_DATE, _parse_num_modifier_from_date),        # 5c
+)
+
+# Tried after LEASE_TERM_HANDLERS, only when the dol parses
+DOL_TERM_HANDLERS = (
+    (PATTERN_YEARS_FROM_DOL, _parse_years_from_dol),                        # 6a
+    (PATTERN_TERM_EXPIRING_DAY_OF, _parse_expiry_from_dol),                 # 6b-1
+    (PATTERN_TERM_EXPIRING, _parse_expiry_from_dol),                        # 6b-2
+    (PATTERN_EXPIRING_ONLY, _parse_expiry_from_dol),                        # 6c
+    (PATTERN_YEARS_ONLY, _parse_years_from_dol),                            # 6d
+    (PATTERN_NUM_PAREN_LESS, _parse_num_paren_less),                        # 6d-2
+    (PATTERN_YEARS_FROM_INCOMPLETE, _parse_years_from_dol),                 # 6e
+    (PATTERN_BEGINNING_DOL_ENDING, _parse_expiry_from_dol),                 # 6f
+    (PATTERN_FROM_DOL_TO_DATE, _parse_expiry_from_dol),                     # 6f-2
+    (PATTERN_FROM_MONTH_TO_MONTH_YEAR, _parse_from_month_to_month_year),    # 6g
+    (PATTERN_SINGLE_DATE, _parse_expiry_from_dol),                          # 6h
+)
+
+def _first_result(handlers: tuple, term_str: str, candidates: Optional[set], *args) -> Optional[LeaseTerm]:
+    """
+    Try each (pattern, handler) pair in order, skipping patterns the prefilter ruled out.
+
+    Returns:
+        The first handler result that is not None, or None if none succeed
+    """
+    for pattern, handler in handlers:
+        if candidates is not None and pattern not in candidates:
+            continue
+        match = pattern.search(term_str)
+        if match:
+            result = handler(match, *args)
+            if result is not None:
+                return result
+    return None
+
+
+def _parse_plain_years_from(term_str: str) -> Optional[LeaseTerm]:
+    """
+    Parse the commonest wording, "N years from D Month YYYY", without a regex.
+
+    Takes the lowercased normalised term and gives the same result as Pattern 3a,
+    the first pattern that can match it. Any other shape, or a date that does not
+    parse, returns None and the patterns decide.
+    """
+    parts = term_str.split()
+    if len(parts) != 6 or parts[2] != 'from' or parts[1] not in ('years', 'year'):
+        return None
+
+    years_str, _, _, day, month, year = parts
+    if not (years_str.isascii() and years_str.isdigit() and len(years_str) <= 6
+            and day.isascii() and day.isdigit() and len(day) <= 2
+            and month.isascii() and (month.isalpha() or (month.isdigit() and len(month) <= 2))
+            and year.isascii() and year.isdigit() and len(year) == 4):
+        return None
+
+    years = parse_fractional_years(years_str)
+    start_date = parse_date(day, month, year)
+    if years and start_date:
+        expiry_date = _calculate_expiry(start_date, years, less_days=0)
+        return _build_result(start_date, expiry_date, years)
+    return None
+
+
+# Wording after "N years" that starts the term on the date of lease (Patterns 6a and 6d)
+DOL_YEARS_TAILS = frozenset({
+    (),
+    ('from', 'the', 'date', 'of', 'the', 'lease'),
+    ('from', 'the', 'date', 'of', 'this', 'lease'),
+    ('from', 'date', 'of', 'lease'),
+    ('commencing', 'on', 'the', 'date', 'of', 'the', 'lease'),
+})
+
+
+def _parse_plain_years_from_dol(term_str: str, dol_date: datetime) -> Optional[LeaseTerm]:
+    """
+    Parse the commonest dol wordings, "N years" and "N years from the date of the lease",
+    without a regex.
+
+    Takes the lowercased normalised term and gives the same result as DOL_TERM_HANDLERS.
+    Any other shape returns None and the patterns decide.
+    """
+    parts = term_str.split()
+    if len(parts) < 2 or parts[1] not in ('years', 'year') or tuple(parts[2:]) not in DOL_YEARS_TAILS:
+        return None
+
+    years_str = parts[0]
+    if not (years_str.isascii() and years_str.isdigit() and len(years_str) <= 6):
+        return None
+
+    years = int(years_str)
+    if years:
+        expiry_date = _calculate_expiry(dol_date, years)
+        return _build_result(dol_date, expiry_date, years)
+    return None
+
+
+@lru_cache(maxsize=65536)
+def _match_term(term_str: str) -> tuple:
+    """
+    Normalise a raw term and try the patterns that do not depend on the date of lease.
+
+    Cached on the term alone: the dol is close to unique per lease, so (term, dol)
+    pairs rarely repeat even when the term wording does.
+
+    Returns:
+        (result, normalised term, lowercased normalised term, prefilter candidates).
+        result is the LeaseTerm from LEASE_TERM_HANDLERS or None; both terms are None
+        when the term has no number at all and nothing, dol patterns included, can match it
+    """
+    term_str = normalise_term_str(term_str)
+
+    # Nothing to extract without a number or date - skip the regex battery entirely
+    if not PATTERN_FAST_REJECT.search(term_str):
+        return None, None, None, None
+
+    # Patterns are lowercase, so match against a lowercased copy rather than ignoring case
+    lowered = term_str.lower()
+
+    result = _parse_plain_years_from(lowered)
+    if result is not None:
+        return result, term_str, lowered, None
+
+    # One multi-pattern scan decides which patterns can match; only those are searched for groups
+    candidates = _matching_patterns(lowered)
+
+    return _first_result(LEASE_TERM_HANDLERS, lowered, candidates), term_str, lowered, candidates
+
+
+@lru_cache(maxsize=131072)
+def parse_lease_term(term_str: str, dol: Optional[str] = None) -> Optional[LeaseTerm]:
     """
     Parse a lease term string to extract start date, expiry date, and tenure.
 
@@ -386,688 +1238,236 @@ def parse_lease_term(term_str: str, dol: Optional[str] = None) -> Optional[Dict[
              references "date of the lease" or has no explicit start date
 
     Returns:
-        Dictionary with 'start_date', 'expiry_date', 'tenure_years', and 'source' keys,
+        LeaseTerm with start_date, expiry_date, tenure_years and extractor,
         or None if parsing fails
+
+    Results are memoised per (term_str, dol), since register data repeats the same
+    boilerplate wording many times. LeaseTerm is immutable, so cached results are
+    safe to share between callers.
     """
     if not term_str:
         return None
 
-    term_str = normalise_term_str(term_str)
-
-    # ========================================================================
-    # PATTERN 1: Years with both start AND end dates explicitly stated
-    # ========================================================================
-    # Examples:
-    #   "10 years from and including 25 August 2020 to and including 24 August 2030"
-    #   "215 years beginning on and including 24 June 1986 and ending on and including 23 June 2201"
-    #   "189 years commencing on and including 01 September 1995 and expiring on and including 31 August 2184"
-    #   "125 years beginning on 1 January 2013 inclusive and ending on 31 December 2138 inclusive"
-    #   "22 years commencing on and including 8 November 2023 and ending on 7 November 2045"
-    pattern_years_start_end = re.compile(
-        rf'{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-        rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}{OPT_INCLUSIVE}\s*'
-        rf'{END_PHRASE}{DATE_PATTERN}{OPT_INCLUSIVE}',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_start_end.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        start_date = parse_date(match.group(2), match.group(3), match.group(4))
-        expiry_date = parse_date(match.group(5), match.group(6), match.group(7))
-        if start_date and expiry_date and years:
-            return _build_result(start_date, expiry_date, years)
-
-    # ========================================================================
-    # PATTERN 2: Date range without explicit years (tenure calculated)
-    # ========================================================================
-    # Examples:
-    #   "From and including 24 June 2020 to and including 23 June 2025"
-    #   "Beginning on and including 1 April 1982 and ending on and including 31 March 2197"
-    #   "commencing on 28 July 2016 and expiring on 27 July 2115"
-    #   "5 June 2002 until 31 December 3001"
-    #   "18 December 1987 expiring on 17 December 2176"
-
-    # Pattern 2a: With start keyword (from/beginning/commencing/starting)
-    pattern_date_range = re.compile(
-        rf'(?:{TERM_PREFIX})?{START_PHRASE}{OPT_THE}{DATE_PATTERN}\s*[,]?\s*'
-        rf'{END_PHRASE}{DATE_PATTERN}{OPT_INCLUSIVE}',
-        re.IGNORECASE
-    )
-
-    match = pattern_date_range.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        expiry_date = parse_date(match.group(4), match.group(5), match.group(6))
-        if start_date and expiry_date:
-            tenure_years = _calculate_tenure_years(start_date, expiry_date)
-            return _build_result(start_date, expiry_date, tenure_years)
-
-    # Pattern 2b: "DD Month YYYY to/until/expiring DD Month YYYY" (no start keyword)
-    pattern_date_to_date = re.compile(
-        rf'^{DATE_PATTERN}\s+(?:to|until|expiring\s+{OPT_ON}{OPT_INCLUDING})\s*{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_date_to_date.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        expiry_date = parse_date(match.group(4), match.group(5), match.group(6))
-        if start_date and expiry_date:
-            tenure_years = _calculate_tenure_years(start_date, expiry_date)
-            return _build_result(start_date, expiry_date, tenure_years)
-
-    # Pattern 2c: "Expiring on DATE from DATE" (expiry date first, then start date)
-    # Example: "Expiring on 21 October 2115 from 22 October 1990"
-    pattern_expiring_from = re.compile(
-        rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_expiring_from.search(term_str)
-    if match:
-        expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-        start_date = parse_date(match.group(4), match.group(5), match.group(6))
-        if start_date and expiry_date:
-            tenure_years = _calculate_tenure_years(start_date, expiry_date)
-            return _build_result(start_date, expiry_date, tenure_years)
-
-    # Pattern 2d: "From DD Month YYYY for a term [of years] expiring on DD Month YYYY"
-    pattern_for_term_expiring = re.compile(
-        rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'{FOR_TERM}{YEARS_WORD}?\s*expiring\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_for_term_expiring.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        expiry_date = parse_date(match.group(4), match.group(5), match.group(6))
-        if start_date and expiry_date:
-            tenure_years = _calculate_tenure_years(start_date, expiry_date)
-            return _build_result(start_date, expiry_date, tenure_years)
-
-    # Pattern 2e: "From [and including] DATE and expiring on the expiration of X years from DATE"
-    # Example: "From and including 19 June 2012 and expiring on the expiration of 999 years from 15 June 2001"
-    # Lease start is the first date, expiry is calculated as second date + X years
-    pattern_expiring_on_expiration_of = re.compile(
-        rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'and\s+expiring\s+on\s+the\s+expiration\s+of\s+{NUM_CAP}\s*{YEARS_WORD}\s+'
-        rf'from\s+{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_expiring_on_expiration_of.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        years = parse_word_number(match.group(4))
-        base_date = parse_date(match.group(5), match.group(6), match.group(7))
-        if start_date and years and base_date:
-            expiry_date = _calculate_expiry(base_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-
-    # ========================================================================
-    # PATTERN 3: Years with modifiers (less/plus days/months, fractional) + start date
-    # ========================================================================
-    # Consolidated pattern handling: fractional years, less/plus days, less months
-    # Examples:
-    #   "97 3/4 years from 25 March 1866"
-    #   "65 and half years from 25 March 1904"
-    #   "52 and a quarter years less 10 days from 25 March 1906"
-    #   "99 years less 10 days from Midsummer Day 1852"
-    #   "67 years (less 3 days) from Midsummer Day 1881"
-    #   "215 years (less 3 days) from and including 24 June 1986"
-    #   "500 years less 9 months from 29 September 1585"
-    #   "999 Years plus 7 days from 01 November 2004"
-    #   "999 years and 10 days commencing on and including 10/5/2024"
-    #   "250 years less 20 days beginning on 18 October 2016"
-    #   "From and including 19 September 1988 for the term of 125 years less the last 5 days"
-
-    # Pattern 3a: Years with optional less/plus days modifier and date/special day
-    pattern_years_with_modifiers = re.compile(
-        rf'^{TERM_PREFIX}{FRACTIONAL_NUM}\s*{YEARS_WORD}'
-        rf'(?:{LESS_DAYS}|{PLUS_DAYS}|{LESS_MONTHS})?'
-        rf'\s+{START_PHRASE}{OPT_THE}'
-        rf'(?:{DATE_PATTERN}|{SPECIAL_DAYS}\s+{YEAR})',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_with_modifiers.search(term_str)
-    if match:
-        years_str = match.group(1)
-        years_float = parse_fractional_years(years_str)
-
-        # Try to extract modifiers - groups vary based on which modifier matched
-        less_days, plus_days, less_months = 0, 0, 0
-        if match.group(2):
-            less_days = parse_word_number(match.group(2)) or 0
-        if match.group(3):
-            plus_days = parse_word_number(match.group(3)) or 0
-        if match.group(4):
-            less_months = parse_word_number(match.group(4)) or 0
-
-        # Check for regular date (groups 5,6,7) or special day (groups 8,9)
-        if match.group(5):  # Regular date
-            start_date = parse_date(match.group(5), match.group(6), match.group(7))
-        else:  # Special day name
-            start_date = resolve_special_day(match.group(8), match.group(9))
-
-        if years_float and start_date:
-            expiry_date = _calculate_expiry(start_date, years_float,
-                                            less_days=less_days,
-                                            plus_days=plus_days,
-                                            less_months=less_months)
-            return _build_result(start_date, expiry_date, years_float)
-
-    # Pattern 3b: "From ... for [the] term [of] X years [less [the] [last] N days]"
-    # Example: "From and including 19 September 1988 for the term of 125 years less the last 5 days"
-    pattern_from_for_term = re.compile(
-        rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'for\s+(?:the\s+)?term\s+(?:of\s+)?{NUM_CAP}\s*{YEARS_WORD}'
-        rf'(?:\s+less\s+(?:the\s+)?(?:last\s+)?{NUM_CAP}\s+days?)?',
-        re.IGNORECASE
-    )
-
-    match = pattern_from_for_term.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        years = parse_word_number(match.group(4))
-        less_days = parse_word_number(match.group(5)) if match.group(5) else 0
-        if start_date and years:
-            expiry_date = _calculate_expiry(start_date, years, less_days=less_days)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 3c: Years with "and X months" modifier
-    # Examples: "31 years and 6 months from 28 March 2024", "20 years and 3 months from and including 9 September 2015"
-    #           "980 years 6 months from 25 March 1923" (without "and")
-    pattern_years_and_months = re.compile(
-        rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s*'
-        rf'(?:and\s+)?{NUM_CAP}\s+months?\s*'
-        rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}'
-        rf'{LESS_DAYS}',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_and_months.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        months = parse_word_number(match.group(2))
-        start_date = parse_date(match.group(3), match.group(4), match.group(5))
-        if years and start_date and months is not None:
-            expiry_date = start_date + relativedelta(years=years, months=months)
-            return _build_result(start_date, expiry_date, years)
+    # Cheapest check first: no dol and no digits means no pattern can match, skip normalising
+    if not dol and not PATTERN_DIGIT.search(term_str):
+        return None
 
-    # ========================================================================
-    # PATTERN 4: Simple years + start date (no modifiers)
-    # ========================================================================
-    # Consolidated patterns for: X years from/commencing/beginning DATE
-    # Examples:
-    #   "99 years from 24 June 1862"
-    #   "999 years from the 22 December 1953"
-    #   "20 years from 28/06/1996"
-    #   "99 years on and from 1 June 2016"
-    #   "215 years beginning on and including 24 June 1988"
-    #   "Ten years beginning on and including 6 December 2016" (word number)
-    #   "125 years from and including the 01 March 2023"
-    #   "99 years from Christmas Day 1900" (special day)
-    #   "From and including 90 years from 2 December 2024" (weird format)
-
-    # Pattern 4a: Standard "X years from/commencing/beginning DATE/SPECIAL_DAY"
-    pattern_years_from_date = re.compile(
-        rf'^(?:from\s+{OPT_INCLUDING})?{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-        rf'{START_PHRASE}{OPT_THE}'
-        rf'(?:{DATE_PATTERN}|{SPECIAL_DAYS}\s+{YEAR})',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_from_date.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        # Check for regular date (groups 2,3,4) or special day (groups 5,6)
-        if match.group(2):
-            start_date = parse_date(match.group(2), match.group(3), match.group(4))
-        else:
-            start_date = resolve_special_day(match.group(5), match.group(6))
-        if years and start_date:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 4b: "[commencing|beginning] on DATE for [a term of] X years"
-    # Example: "commencing on 10 may 2013 for a term of 125 years"
-    pattern_commencing_for_term = re.compile(
-        rf'(?:commencing|beginning|starting)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'{FOR_TERM}{NUM_CAP}\s*{YEARS_WORD}',
-        re.IGNORECASE
-    )
-
-    match = pattern_commencing_for_term.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        years = parse_word_number(match.group(4))
-        if start_date and years:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 4c: "from [and including] DATE for [a term of] X years"
-    # Example: "from and including 1 October 2002 for 20 years", "From 25 May 1988 for a term of 212 years"
-    pattern_from_for_years = re.compile(
-        rf'from\s+{OPT_INCLUDING}{DATE_PATTERN}\s+'
-        rf'for\s+(?:a\s+term\s+(?:of\s+)?)?{NUM_CAP}\s*{YEARS_WORD}',
-        re.IGNORECASE
-    )
-
-    match = pattern_from_for_years.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        years = parse_word_number(match.group(4))
-        if start_date and years:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 4d: "X years expiring/to [and including] DATE" (expiry-based, calculate start)
-    # Examples: "147 years expiring on 23 June 2161", "15 years to and including 9 December 2039"
-    pattern_years_expiring = re.compile(
-        rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-        rf'(?:expiring|to)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_expiring.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        expiry_date = parse_date(match.group(2), match.group(3), match.group(4))
-        if years and expiry_date:
-            start_date = expiry_date - relativedelta(years=years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 4e: "starts/commencing DATE and expiring X years thereafter"
-    # Example: "Commences on 28 July 2024 and expires 50 years thereafter"
-    pattern_date_years_thereafter = re.compile(
-        rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}\s+'
-        rf'and\s+(?:expiring|expiry)\s+{NUM_CAP}\s*{YEARS_WORD}\s+thereafter',
-        re.IGNORECASE
-    )
-
-    match = pattern_date_years_thereafter.search(term_str)
-    if match:
-        start_date = parse_date(match.group(1), match.group(2), match.group(3))
-        years = parse_word_number(match.group(4))
-        if start_date and years:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 4f: "X years from [and including] Month YYYY" (no day, defaults to 1st)
-    # Example: "999 years from and including December 2023", "125 years from January 2020"
-    pattern_years_from_month_year = re.compile(
-        rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-        rf'(?:from|commencing|beginning|starting)(?:\s+(?:on|from))?\s*(?:and\s+including\s+)?'
-        rf'([A-Za-z]+)\s+(\d{{4}})(?:\s*$|\s)',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_from_month_year.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        start_date = parse_month_year_date(match.group(2), match.group(3))
-        if years and start_date:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
+    result, term_str, lowered, candidates = _match_term(term_str)
+    if result is not None or term_str is None:
+        return result
 
-    # ========================================================================
-    # PATTERN 5: Fallback patterns (missing keywords)
-    # ========================================================================
-    # Examples:
-    #   "999 years 25 March 1896" (missing 'from')
-    #   "999 from 27 April 2006" (missing "years")
-
-    # Pattern 5a: "X years DD Month YYYY" (missing 'from')
-    pattern_years_date_no_from = re.compile(
-        rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_years_date_no_from.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        start_date = parse_date(match.group(2), match.group(3), match.group(4))
-        if years and start_date:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 5b: "X from DD Month YYYY" (missing "years")
-    pattern_num_from_date = re.compile(
-        rf'^(\d{{1,4}})\s+from\s+{OPT_THE}{OPT_INCLUDING}{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_num_from_date.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        start_date = parse_date(match.group(2), match.group(3), match.group(4))
-        if years and start_date:
-            expiry_date = _calculate_expiry(start_date, years)
-            return _build_result(start_date, expiry_date, years)
-
-    # Pattern 5c: "X less N days from DATE" or "X and N day(s) from DATE" (missing "years")
-    # Examples: "125 less 1 day from 1 May 1989", "999 less ten days from 23 March 1958"
-    #           "99 less 10 days from 2.4.1986", "999 and 1 day from 28 March 1988"
-    pattern_num_modifier_from_date = re.compile(
-        rf'^(\d{{1,6}})\s+(?:(less|and)\s+({NUM})\s+days?)\s+'
-        rf'{START_PHRASE}{OPT_THE}{DATE_PATTERN}',
-        re.IGNORECASE
-    )
-
-    match = pattern_num_modifier_from_date.search(term_str)
-    if match:
-        years = parse_word_number(match.group(1))
-        modifier_type = match.group(2).lower() if match.group(2) else None
-        modifier_days = parse_word_number(match.group(3)) if match.group(3) else 0
-        start_date = parse_date(match.group(4), match.group(5), match.group(6))
-        if years and start_date:
-            less_days = modifier_days if modifier_type == 'less' else 0
-            plus_days = modifier_days if modifier_type == 'and' else 0
-            expiry_date = _calculate_expiry(start_date, years, less_days=less_days, plus_days=plus_days)
-            return _build_result(start_date, expiry_date, years)
-
-    # ========================================================================
-    # PATTERN 6: Date of Lease (dol) patterns - start date from dol field
-    # ========================================================================
-    # Parse dol once if provided
+    # Parse dol only once no pattern with an explicit start date has matched
     dol_date = parse_dol_date(dol) if dol else None
-
     if dol_date:
-        # Pattern 6a: "X years from [the] date [of] [this] [the] lease"
-        # Examples: "999 years from the date of the lease", "125 years from date of lease",
-        #           "150 years commencing on the date of the lease",
-        #           "250 years commencing on the date of this lease"
-        pattern_years_from_dol = re.compile(
-            rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-            rf'(?:{START_KW}(?:\s+on)?)\s+{OPT_THE}date\s+(?:of\s+)?(?:this\s+)?{OPT_THE}lease',
-            re.IGNORECASE
-        )
-
-        match = pattern_years_from_dol.search(term_str)
-        if match:
-            years = parse_word_number(match.group(1))
-            if years:
-                expiry_date = _calculate_expiry(dol_date, years)
-                return _build_result(dol_date, expiry_date, years)
-
-        # Pattern 6b: "[For] [a] term [of [years]] expiring/ending on [the] [Nth day of] DD Month YYYY"
-        # or "[a] number of years ending on DD Month YYYY"
-        # (no tenure specified, calculate from dol)
-        # Examples: "a term of years expiring on 23 June 2237",
-        #           "A number of years ending on 12 November 2179",
-        #           "a term expiring on 31 August 2088",
-        #           "term expiring on 15 March 2200",
-        #           "For a term expiring on the 31st day of March 2122",
-        #           "for a term expiring on 31 March 2118"
-
-        # Pattern 6b-1: Handle "the Nth day of Month Year" format specifically
-        # Example: "For a term expiring on the 31st day of March 2122"
-        pattern_term_expiring_day_of = re.compile(
-            rf'^(?:for\s+)?(?:a\s+)?(?:term|number)(?:\s+of)?(?:\s+years?)?\s+'
-            rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{OPT_THE}(\d{{1,2}})\s+day\s+of\s+([A-Za-z]+)\s+(\d{{4}})',
-            re.IGNORECASE
-        )
-
-        match = pattern_term_expiring_day_of.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
-
-        # Pattern 6b-2: Standard format without "day of"
-        pattern_term_expiring = re.compile(
-            rf'^(?:for\s+)?(?:a\s+)?(?:term|number)(?:\s+of)?(?:\s+years?)?\s+'
-            rf'(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}',
-            re.IGNORECASE
-        )
-
-        match = pattern_term_expiring.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
-
-        # Pattern 6c: "expiring on DD Month YYYY" (just expiry, no term prefix)
-        pattern_expiring_only = re.compile(
-            rf'^(?:expiring|ending)\s+{OPT_ON}{OPT_INCLUDING}{DATE_PATTERN}$',
-            re.IGNORECASE
-        )
-
-        match = pattern_expiring_only.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
-
-        # Pattern 6d: "X years [less N days]" or "X (less N days)" (just tenure, optional modifier, start from dol)
-        # Examples: "999 years less 6 days", "999 years", "999 (less 10 days)"
-        pattern_years_only = re.compile(
-            rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}?'
-            rf'(?:\s*\(?\s*less\s+{NUM_CAP}\s+days?\s*\)?)?$',
-            re.IGNORECASE
-        )
-
-        match = pattern_years_only.search(term_str)
-        if match:
-            years = parse_word_number(match.group(1))
-            # Ignore less days per requirement
-            if years:
-                expiry_date = _calculate_expiry(dol_date, years)
-                return _build_result(dol_date, expiry_date, years)
-
-        # Pattern 6d-2: "NNN (less N days)" - specific pattern for number with parenthetical less days
-        # Example: "999 (less 10 days)"
-        pattern_num_paren_less = re.compile(
-            rf'^(\d{{1,4}})\s*\(\s*less\s+(\d+)\s+days?\s*\)$',
-            re.IGNORECASE
-        )
-
-        match = pattern_num_paren_less.search(term_str)
-        if match:
-            years = int(match.group(1))
-            # Ignore less days per requirement
-            if years:
-                expiry_date = _calculate_expiry(dol_date, years)
-                return _build_result(dol_date, expiry_date, years)
-
-        # Pattern 6e: "X years from/commencing/beginning [and including]" (incomplete, uses dol)
-        # Examples: "125 years from", "125 years from and including", "200 years commencing"
-        pattern_years_from_incomplete = re.compile(
-            rf'^{TERM_PREFIX}{NUM_CAP}\s*{YEARS_WORD}\s+'
-            rf'(?:from|commencing|beginning|starting)(?:\s+(?:on|from))?(?:\s+and\s+including)?$',
-            re.IGNORECASE
-        )
-
-        match = pattern_years_from_incomplete.search(term_str)
-        if match:
-            years = parse_word_number(match.group(1))
-            if years:
-                expiry_date = _calculate_expiry(dol_date, years)
-                return _build_result(dol_date, expiry_date, years)
-
-        # Pattern 6f: "beginning on [, and including] [the] date of this lease and ending on [,] DD Month YYYY"
-        # Example: "beginning on, and including the date of this lease and ending on, 1 March 2032"
-        pattern_beginning_dol_ending = re.compile(
-            rf'beginning\s+on[,]?\s*{OPT_INCLUDING}{OPT_THE}date\s+of\s+(?:this\s+)?(?:the\s+)?lease\s+'
-            rf'{END_PHRASE}{DATE_PATTERN}',
-            re.IGNORECASE
-        )
-
-        match = pattern_beginning_dol_ending.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
-
-        # Pattern 6f-2: "from [and including] [the] date [of] [the] lease [up to / and expiring on] DATE"
-        # Examples: "from and including the date hereof up to 13 March 2956",
-        #           "from the date of the lease and expiring on 1 February 3003"
-        pattern_from_dol_to_date = re.compile(
-            rf'from\s+{OPT_INCLUDING}{OPT_THE}date\s+(?:of\s+)?(?:this\s+)?{OPT_THE}lease\s+'
-            rf'(?:up\s+to|{END_PHRASE})\s*{DATE_PATTERN}',
-            re.IGNORECASE
-        )
-
-        match = pattern_from_dol_to_date.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
-
-        # Pattern 6g: "From [and including] DD Month to [and including] DD Month YYYY"
-        # (start year same as dol year)
-        # Example: "From and including 30 September to and including 29 September 2031"
-        pattern_from_month_to_month_year = re.compile(
-            rf'from\s+{OPT_INCLUDING}(\d{{1,2}})\s+([A-Za-z]+)\s+'
-            rf'to\s+{OPT_INCLUDING}{DATE_PATTERN}',
-            re.IGNORECASE
-        )
-
-        match = pattern_from_month_to_month_year.search(term_str)
-        if match:
-            start_day, start_month = match.group(1), match.group(2)
-            end_day, end_month, end_year = match.group(3), match.group(4), match.group(5)
-            # Start year comes from dol
-            start_year = str(dol_date.year)
-            start_date = parse_date(start_day, start_month, start_year)
-            expiry_date = parse_date(end_day, end_month, end_year)
-            if start_date and expiry_date:
-                tenure_years = _calculate_tenure_years(start_date, expiry_date)
-                return _build_result(start_date, expiry_date, tenure_years)
-
-        # Pattern 6h: Single date as expiry date (e.g., "18 April 1997")
-        # Uses dol as start date
-        pattern_single_date = re.compile(
-            rf'^{DATE_PATTERN}$',
-            re.IGNORECASE
-        )
-
-        match = pattern_single_date.search(term_str)
-        if match:
-            expiry_date = parse_date(match.group(1), match.group(2), match.group(3))
-            if expiry_date:
-                tenure_years = _calculate_tenure_years(dol_date, expiry_date)
-                return _build_result(dol_date, expiry_date, tenure_years)
+        result = _parse_plain_years_from_dol(lowered, dol_date)
+        if result is None:
+            result = _first_result(DOL_TERM_HANDLERS, lowered, candidates, dol_date)
+        if result is not None:
+            return result
 
     # ========================================================================
     # FALLBACK: Remove parenthetical text and retry
     # ========================================================================
     # If all patterns failed and there's text in parentheses, remove it and retry
     # Example: "99 years (renewable) from 24 June 1862" -> "99 years from 24 June 1862"
-    term_without_parens = re.sub(r'\s*\([^)]*\)', '', term_str).strip()
+    term_without_parens = PATTERN_PARENTHETICAL.sub('', term_str).strip()
     if term_without_parens != term_str:
         return parse_lease_term(term_without_parens, dol=dol)
 
     return None
 
 
-def normalise_term_str(term_str: str) -> str:
+def parse_lease_terms(terms: pd.Series, dols: Optional[pd.Series] = None) -> pd.DataFrame:
     """
-    Normalise lease term string for parsing by removing extra whitespace and fixing common issues.
-    :param term_str: the input lease term string
-    :return: normalised lease term string
+    Parse a column of lease term strings.
+
+    Register extracts repeat the same term wording (and date of lease) many
+    times, so each distinct (term, dol) pair is parsed once and the result is
+    broadcast back onto every row that shares it.
+
+    Args:
+        terms: Series of lease term strings
+        dols: Optional Series of date of lease strings, aligned with terms
+
+    Returns:
+        DataFrame indexed like terms with start_date, expiry_date, tenure_years
+        and extractor columns. Rows that cannot be parsed (including dates
+        beyond datetime's range) are left as None
     """
-    term_str = re.sub(r'[\s\u00A0]+', ' ', term_str.strip())
+    if dols is None:
+        dols = pd.Series(None, index=terms.index, dtype=object)
+    else:
+        dols = dols.reindex(terms.index)
+
+    # Factorise each column in C, then combine the codes into one key per (term, dol) pair.
+    # Missing values get code -1, which the +1 shift maps to 0.
+    term_codes, term_values = pd.factorize(terms)
+    dol_codes, dol_values = pd.factorize(dols)
+    pair_keys = (term_codes + 1) * (len(dol_values) + 1) + (dol_codes + 1)
+    _, first_rows, row_codes = np.unique(pair_keys, return_index=True, return_inverse=True)
+
+    parsed = []
+    for row in first_rows:
+        term = term_values[term_codes[row]] if term_codes[row] >= 0 else None
+        dol = dol_values[dol_codes[row]] if dol_codes[row] >= 0 else None
+        try:
+            lease_term = parse_lease_term(
+                term if isinstance(term, str) else None,
+                dol if isinstance(dol, str) else None,
+            )
+        except (ValueError, OverflowError):
+            lease_term = None
+        parsed.append(lease_term or (None,) * len(LeaseTerm._fields))
+
+    # Build each column once over the distinct pairs and broadcast it to every row
+    columns = {
+        field: np.array([lease_term[i] for lease_term in parsed], dtype=object)[row_codes]
+        for i, field in enumerate(LeaseTerm._fields)
+    }
+    return pd.DataFrame(columns, index=terms.index, dtype=object)
+
+
+def clear_caches() -> None:
+    """Clear the memoised results of parse_lease_term and the parsers behind it."""
+    for cached in (parse_lease_term, _match_term, parse_date, parse_dol_date,
+                   parse_fractional_years, resolve_special_day):
+        cached.cache_clear()
+
+
+# Misspellings corrected during normalisation (lowercase typo -> replacement)
+SPELLING_FIXES = {
+    'les': 'less',
+    'januaryu': 'January',
+    'jnuary': 'January',
+    'feburary': 'February',
+    'febuary': 'February',
+    'septmber': 'September',
+    'novmber': 'November',
+    'decmber': 'December',
+}
+
+# Ordinal day suffix (group 1 is the day) or one of the misspellings above
+PATTERN_ORDINAL_OR_TYPO = re.compile(
+    rf'\b(\d{{1,2}})(?:st|nd|rd|th)\b|\b(?:{"|".join(SPELLING_FIXES)})\b',
+    re.IGNORECASE
+)
 
-    # Remove problematic special characters (but keep colons for date formats like 12:7:1973)
-    term_str = term_str.replace('´', '').replace('~', '').replace('¨', '').replace(',', '').replace('?', '')
 
-    # Remove "Residue of" prefix (also handles "residue of the term of")
-    term_str = re.sub(r'^(?:For\s+)?(?:the\s+)?Residue\s+of\s+(?:the\s+)?(?:term\s+of\s+)?', '', term_str, flags=re.IGNORECASE)
+def _fix_ordinal_or_typo(match: re.Match) -> str:
+    """Substitution callback for PATTERN_ORDINAL_OR_TYPO."""
+    day = match.group(1)
+    if day is not None:
+        return day
+    return SPELLING_FIXES[match.group(0).lower()]
 
-    # Remove "midnight on" phrases
-    term_str = term_str.replace(" midnight on", "")
-    term_str = term_str.replace(" midnight", "")
-    term_str = term_str.replace("and and", "and")
-    term_str = term_str.replace("Nine hundred and ninety nine", "999")
-    term_str = term_str.replace("Two hundred and fifty", "250")
-    term_str = term_str.replace("¼", "")
-    term_str = term_str.replace("½", "")
-    term_str = term_str.replace("¾", "")
 
-    # Remove ordinal suffixes from dates (1st -> 1, 2nd -> 2, etc.)
-    term_str = re.sub(r'\b(\d{1,2})(?:st|nd|rd|th)\b', r'\1', term_str, flags=re.IGNORECASE)
+# Characters dropped before matching; colons are kept for date formats like 12:7:1973
+REMOVED_CHARS = str.maketrans('', '', '´~¨,?')
 
-    # Remove "of" between day and month (e.g., "1 of January" -> "1 January")
-    term_str = re.sub(r'\b(\d{1,2})\s+of\s+([A-Za-z]+)\b', r'\1 \2', term_str, flags=re.IGNORECASE)
+# Vulgar fractions, dropped after the spelt-out numbers are replaced
+FRACTION_CHARS = str.maketrans('', '', '¼½¾')
 
-    # Fix "including on" -> "including" (duplicate "on")
-    term_str = re.sub(r'\bincluding\s+on\b', 'including', term_str, flags=re.IGNORECASE)
+# "Residue of" prefix (also handles "residue of the term of")
+PATTERN_RESIDUE_PREFIX = re.compile(
+    r'^(?:For\s+)?(?:the\s+)?Residue\s+of\s+(?:the\s+)?(?:term\s+of\s+)?', re.IGNORECASE
+)
 
+# Fixes applied in order after the ordinal/typo pass, as (keyword, pattern, replacement).
+# Every match contains the lowercase keyword, so terms without it skip the regex
+NORMALISATION_FIXES = (
+    # Remove "of" between day and month (e.g., "1 of January" -> "1 January")
+    ('of', re.compile(r'\b(\d{1,2})\s+of\s+([A-Za-z]+)\b', re.IGNORECASE), r'\1 \2'),
+    # Fix "including on" -> "including" (duplicate "on")
+    ('including', re.compile(r'\bincluding\s+on\b', re.IGNORECASE), 'including'),
     # Fix "to and expiring" -> "to" or "expiring" (redundant)
-    term_str = re.sub(r'\bto\s+and\s+expiring\b', 'expiring', term_str, flags=re.IGNORECASE)
-
+    ('expiring', re.compile(r'\bto\s+and\s+expiring\b', re.IGNORECASE), 'expiring'),
     # Fix "an including" -> "and including" (typo)
-    term_str = re.sub(r'\ban\s+including\b', 'and including', term_str, flags=re.IGNORECASE)
-
+    ('including', re.compile(r'\ban\s+including\b', re.IGNORECASE), 'and including'),
     # Fix "beginning in," -> "beginning on" (typo)
-    term_str = re.sub(r'\bbeginning\s+in\b', 'beginning on', term_str, flags=re.IGNORECASE)
-
-    # Fix "ending on," -> "ending on" (extra comma already removed above)
+    ('beginning', re.compile(r'\bbeginning\s+in\b', re.IGNORECASE), 'beginning on'),
     # Fix "Commences" -> "commencing", "expires" -> "expiring"
-    term_str = re.sub(r'\bCommences\b', 'commencing', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bexpires\b', 'expiring', term_str, flags=re.IGNORECASE)
-
+    ('commences', re.compile(r'\bCommences\b', re.IGNORECASE), 'commencing'),
+    ('expires', re.compile(r'\bexpires\b', re.IGNORECASE), 'expiring'),
     # Remove colons after From/To (e.g., "From:" -> "From", "To:" -> "to")
-    term_str = re.sub(r'\bFrom\s*:', 'From', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bTo\s*:', 'to', term_str, flags=re.IGNORECASE)
-
+    (':', re.compile(r'\bFrom\s*:', re.IGNORECASE), 'From'),
+    (':', re.compile(r'\bTo\s*:', re.IGNORECASE), 'to'),
     # Convert colon date separators to dots (e.g., "12:7:1973" -> "12.7.1973")
-    term_str = re.sub(r'\b(\d{1,2}):(\d{1,2}):(\d{4})\b', r'\1.\2.\3', term_str)
-
-    # Fix common spelling errors
-    term_str = re.sub(r'\bles\b', 'less', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\brom\b', 'from', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bfrm\b', 'from', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bform\b', 'from', term_str, flags=re.IGNORECASE)  # "form" -> "from"
-    term_str = re.sub(r'\bJanuaryu\b', 'January', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bJnuary\b', 'January', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bFeburary\b', 'February', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bFebuary\b', 'February', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bSeptmber\b', 'September', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bNovmber\b', 'November', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\bDecmber\b', 'December', term_str, flags=re.IGNORECASE)
-
+    (':', re.compile(r'\b(\d{1,2}):(\d{1,2}):(\d{4})\b'), r'\1.\2.\3'),
+    # Fix common misspellings of "from"
+    ('rom', re.compile(r'\brom\b', re.IGNORECASE), 'from'),
+    ('rm', re.compile(r'\b(?:frm|form)\b', re.IGNORECASE), 'from'),
     # Fix malformed phrases
-    term_str = re.sub(r'\band\s+to\s+and\s+including\b', 'to and including', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\band\s+including\s+to\s+and\s+including\b', 'to and including', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\btherein\s+mentioned\b', 'the lease', term_str, flags=re.IGNORECASE)  # "date as therein mentioned" -> "date as the lease"
-    term_str = re.sub(r'\bas\s+the\s+lease\b', 'of the lease', term_str, flags=re.IGNORECASE)  # "date as the lease" -> "date of the lease"
-
+    ('including', re.compile(r'\band\s+to\s+and\s+including\b', re.IGNORECASE), 'to and including'),
+    ('including', re.compile(r'\band\s+including\s+to\s+and\s+including\b', re.IGNORECASE), 'to and including'),
+    # "date as therein mentioned" -> "date as the lease" -> "date of the lease"
+    ('therein', re.compile(r'\btherein\s+mentioned\b', re.IGNORECASE), 'the lease'),
+    ('lease', re.compile(r'\bas\s+the\s+lease\b', re.IGNORECASE), 'of the lease'),
     # Fix missing space between "from" and date (e.g., "from1 January" -> "from 1 January")
-    term_str = re.sub(r'\bfrom(\d)', r'from \1', term_str, flags=re.IGNORECASE)
-
+    ('from', re.compile(r'\bfrom(\d)', re.IGNORECASE), r'from \1'),
     # Fix ")for" typo -> ") from" (e.g., "999 (less 10 days)for" -> "999 (less 10 days) from")
-    term_str = re.sub(r'\)for\b', ') from', term_str, flags=re.IGNORECASE)
-
+    (')for', re.compile(r'\)for\b', re.IGNORECASE), ') from'),
     # Fix "date hereof" -> "date of the lease"
-    term_str = re.sub(r'\bdate\s+hereof\b', 'date of the lease', term_str, flags=re.IGNORECASE)
-
+    ('hereof', re.compile(r'\bdate\s+hereof\b', re.IGNORECASE), 'date of the lease'),
     # Fix "including/from" -> "including" (typo with slash)
-    term_str = re.sub(r'\bincluding/from\b', 'including', term_str, flags=re.IGNORECASE)
-
+    ('including/', re.compile(r'\bincluding/from\b', re.IGNORECASE), 'including'),
     # Fix invalid dates: 31 June -> 30 June, 31 April -> 30 April (months with only 30 days)
-    term_str = re.sub(r'\b31\s+(June|April|September|November)\b', r'30 \1', term_str, flags=re.IGNORECASE)
+    ('31', re.compile(r'\b31\s+(June|April|September|November)\b', re.IGNORECASE), r'30 \1'),
     # Also fix numeric format: 31/4 -> 30/4, 31/6 -> 30/6, 31/9 -> 30/9, 31/11 -> 30/11
-    term_str = re.sub(r'\b31[/.](?=4|6|9|11)\b', r'30/', term_str)
-    term_str = re.sub(r'\b31/4\b', '30/4', term_str)
-    term_str = re.sub(r'\b31/6\b', '30/6', term_str)
-    term_str = re.sub(r'\b31/9\b', '30/9', term_str)
-    term_str = re.sub(r'\b31/11\b', '30/11', term_str)
-
+    ('31', re.compile(r'\b31[/.](?=4|6|9|11)\b'), r'30/'),
+    ('31', re.compile(r'\b31/4\b'), '30/4'),
+    ('31', re.compile(r'\b31/6\b'), '30/6'),
+    ('31', re.compile(r'\b31/9\b'), '30/9'),
+    ('31', re.compile(r'\b31/11\b'), '30/11'),
     # Remove trailing "hereof" and similar
-    term_str = re.sub(r'\s+hereof\s*$', '', term_str, flags=re.IGNORECASE)
-    term_str = re.sub(r'\s+thereof\s*$', '', term_str, flags=re.IGNORECASE)
+    ('hereof', re.compile(r'\s+hereof\s*$', re.IGNORECASE), ''),
+    ('thereof', re.compile(r'\s+thereof\s*$', re.IGNORECASE), ''),
+)
 
-    return term_str.strip()
 
+def normalise_term_str(term_str: str) -> str:
+    """
+    Normalise lease term string for parsing by removing extra whitespace and fixing common issues.
+    :param term_str: the input lease term string
+    :return: normalised lease term string
+    """
+    # str.split() splits on the same characters as [\s\u00A0]+ and drops them at both ends
+    term_str = ' '.join(term_str.split())
+
+    # Remove problematic special characters (but keep colons for date formats like 12:7:1973)
+    term_str = term_str.translate(REMOVED_CHARS)
+
+    # Keyword checks stand in for the case-insensitive regexes only on ASCII text:
+    # re.IGNORECASE also matches dotted/dotless i, which str.lower() leaves alone
+    check_keywords = term_str.isascii()
+    if not check_keywords:
+        # RE2's \d is ASCII-only, so other decimal digits (e.g. Arabic-Indic) are made ASCII
+        term_str = ''.join(
+            str(unicodedata.decimal(char)) if char.isdecimal() else char for char in term_str
+        )
+    lowered = term_str.lower()
+
+    # Remove "Residue of" prefix (also handles "residue of the term of")
+    if not check_keywords or 'residue' in lowered:
+        term_str = PATTERN_RESIDUE_PREFIX.sub('', term_str)
+
+    # Remove "midnight on" phrases
+    term_str = term_str.replace(" midnight on", "")
+    term_str = term_str.replace(" midnight", "")
+    term_str = term_str.replace("and and", "and")
+    term_str = term_str.replace("Nine hundred and ninety nine", "999")
+    term_str = term_str.replace("Two hundred and fifty", "250")
+    term_str = term_str.translate(FRACTION_CHARS)
+
+    # Remove ordinal suffixes from dates (1st -> 1, 2nd -> 2, etc.) and fix misspelt words, in one pass
+    term_str = PATTERN_ORDINAL_OR_TYPO.sub(_fix_ordinal_or_typo, term_str)
+
+    lowered = term_str.lower()
+    for keyword, pattern, replacement in NORMALISATION_FIXES:
+        if check_keywords and keyword not in lowered:
+            continue
+        fixed = pattern.sub(replacement, term_str)
+        if fixed != term_str:
+            term_str = fixed
+            lowered = term_str.lower()
+
+    return term_str.strip()
@@ -8,12 +8,32 @@ the regex extractor couldn't handle.
 
 import re
 from datetime import datetime
-from dateutil.relativedelta import relativedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import torch
 from transformers import T5Tokenizer, T5ForConditionalGeneration
 
+from src.utils.regex_extractors import SPECIAL_DAY_DATES, parse_dol_date
+from src.utils.date_utils import add_months, whole_months_between, whole_years
+
+# Special day names (lowercase) and their (month, day) from SPECIAL_DAY_DATES, checked in
+# this order by _parse_date. "lady" alone is too loose for free text, so Lady Day needs its "day".
+SPECIAL_DAYS = tuple(
+    ('lady day' if name == 'lady' else name, month_day) for name, month_day in SPECIAL_DAY_DATES.items()
+)
+
+# Year of a special day, e.g. the 1900 in "Christmas Day 1900"
+PATTERN_YEAR = re.compile(r'\d{4}')
+
+# DD/MM/YYYY date in T5 output, captured so one split yields the dates and the text around them
+PATTERN_T5_DATE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+
+# Special day and year in T5 output, e.g. "Christmas Day 1900"
+PATTERN_T5_SPECIAL_DAY = re.compile(r'(Christmas|Midsummer|Lady|Michaelmas)(?:\s+Day)?\s+(\d{4})', re.IGNORECASE)
+
+# Tenure in years, e.g. "99 years" or "25 years less 3 days"
+PATTERN_TENURE = re.compile(r'(\d+)\s*years?', re.IGNORECASE)
+
 
 class T5LeaseExtractor:
     """T5-based lease term extractor with lazy model loading."""
@@ -67,26 +87,17 @@ class T5LeaseExtractor:
 
         date_str = date_str.strip()
 
-        # Try standard date formats
-        for fmt in ["%d/%m/%Y", "%d.%m.%Y", "%d-%m-%Y"]:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+        # Try standard date formats (same DD/MM/YYYY, DD.MM.YYYY and DD-MM-YYYY rules as the dol)
+        parsed = parse_dol_date(date_str)
+        if parsed is not None:
+            return parsed
 
         # Handle special day names (e.g., "Christmas Day 1900")
-        special_days = {
-            'christmas': (12, 25),
-            'midsummer': (6, 24),
-            'lady day': (3, 25),
-            'michaelmas': (9, 29),
-        }
-
         date_str_lower = date_str.lower()
-        for day_name, (month, day) in special_days.items():
+        for day_name, (month, day) in SPECIAL_DAYS:
             if day_name in date_str_lower:
                 # Extract year from string
-                year_match = re.search(r'\d{4}', date_str)
+                year_match = PATTERN_YEAR.search(date_str)
                 if year_match:
                     return datetime(int(year_match.group()), month, day)
 
@@ -112,7 +123,7 @@ class T5LeaseExtractor:
             return None
 
         # Extract the primary year number
-        match = re.search(r'(\d+)\s*years?', tenure_str, re.IGNORECASE)
+        match = PATTERN_TENURE.search(tenure_str)
         if match:
             return int(match.group(1))
 
@@ -138,9 +149,9 @@ class T5LeaseExtractor:
 
         output = output.strip()
 
-        # Try to find date patterns (DD/MM/YYYY)
-        date_pattern = r'\d{2}/\d{2}/\d{4}'
-        dates = re.findall(date_pattern, output)
+        # Find date patterns (DD/MM/YYYY); the split puts them at the odd positions
+        parts = PATTERN_T5_DATE.split(output)
+        dates = parts[1::2]
 
         start_date = None
         expiry_date = None
@@ -153,7 +164,7 @@ class T5LeaseExtractor:
 
         # Extract tenure from the remaining text
         # Remove dates from the output to find tenure
-        remaining = re.sub(date_pattern, '', output)
+        remaining = ''.join(parts[0::2])
         remaining = remaining.replace('Not specified', '').strip()
 
         if remaining:
@@ -165,30 +176,21 @@ class T5LeaseExtractor:
             tenure_years = self._parse_tenure(output)
 
             # Check for special day + year patterns
-            special_match = re.search(r'(Christmas|Midsummer|Lady|Michaelmas)(?:\s+Day)?\s+(\d{4})', output, re.IGNORECASE)
+            special_match = PATTERN_T5_SPECIAL_DAY.search(output)
             if special_match:
-                day_name = special_match.group(1).lower()
-                year = int(special_match.group(2))
-                special_days = {
-                    'christmas': (12, 25),
-                    'midsummer': (6, 24),
-                    'lady': (3, 25),
-                    'michaelmas': (9, 29),
-                }
-                if day_name in special_days:
-                    month, day = special_days[day_name]
-                    start_date = datetime(year, month, day)
+                month, day = SPECIAL_DAY_DATES[special_match.group(1).lower()]
+                start_date = datetime(int(special_match.group(2)), month, day)
 
         # If we have start_date and tenure but no expiry, calculate expiry
         if start_date and tenure_years and not expiry_date:
-            expiry_date = start_date + relativedelta(years=tenure_years)
+            expiry_date = add_months(start_date, tenure_years * 12)
 
         # If we have start and expiry but no tenure, calculate tenure
         if start_date and expiry_date and not tenure_years:
-            delta = relativedelta(expiry_date, start_date)
-            tenure_years = delta.years
+            months = whole_months_between(start_date, expiry_date)
+            tenure_years = whole_years(months)
             # Round up if close to a year boundary
-            if delta.months >= 6:
+            if months - tenure_years * 12 >= 6:
                 tenure_years += 1
 
         return {
@@ -223,7 +225,7 @@ class T5LeaseExtractor:
         ).input_ids
 
         # Generate output
-        with torch.no_grad():
+        with torch.inference_mode():
             output_ids = self.model.generate(
                 input_ids,
                 max_length=self._max_length,
@@ -234,6 +236,62 @@ class T5LeaseExtractor:
         # Decode output
         raw_output = self.tokenizer.decode(output_ids[0], skip_special_tokens=True)
 
+        return self._build_result(raw_output, dol)
+
+    def extract_batch(self, term_strs: List[str],
+                      dols: Optional[List[Optional[str]]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract lease term data from many term strings with a single model.generate call.
+
+        Args:
+            term_strs: The lease term strings to parse
+            dols: Optional date of lease strings, aligned with term_strs
+
+        Returns:
+            One result per term string, in the same order, as returned by extract
+        """
+        if dols is None:
+            dols = [None] * len(term_strs)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(term_strs)
+        indices = [i for i, term_str in enumerate(term_strs) if term_str and term_str.strip()]
+        if not indices:
+            return results
+
+        # Pad to the longest input in the batch rather than to max_length
+        inputs = self.tokenizer(
+            [f"parse lease: {term_strs[i]}" for i in indices],
+            max_length=self._max_length,
+            padding=True,
+            truncation=True,
+            return_tensors='pt'
+        )
+
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                inputs.input_ids,
+                attention_mask=inputs.attention_mask,
+                max_length=self._max_length,
+                num_beams=4,
+                early_stopping=True
+            )
+
+        raw_outputs = self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
+        for i, raw_output in zip(indices, raw_outputs):
+            results[i] = self._build_result(raw_output, dols[i])
+        return results
+
+    def _build_result(self, raw_output: str, dol: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Turn a decoded T5 output into the extract result.
+
+        Args:
+            raw_output: The decoded T5 output string
+            dol: Optional date of lease string, used when the output has no start date
+
+        Returns:
+            Result dictionary, or None if the output does not carry enough data
+        """
         # Parse the T5 output
         parsed = self._parse_t5_output(raw_output)
 
@@ -242,7 +300,7 @@ class T5LeaseExtractor:
             parsed['start_date'] = self._parse_dol_date(dol)
             # Recalculate expiry if we now have start_date and tenure
             if parsed['start_date'] and parsed['tenure_years'] and not parsed['expiry_date']:
-                parsed['expiry_date'] = parsed['start_date'] + relativedelta(years=parsed['tenure_years'])
+                parsed['expiry_date'] = add_months(parsed['start_date'], parsed['tenure_years'] * 12)
 
         # Check if we have enough data to be valid
         has_valid_data = (
@@ -271,16 +329,7 @@ class T5LeaseExtractor:
         Returns:
             datetime object or None if parsing fails
         """
-        if not dol:
-            return None
-
-        dol = dol.strip()
-        for fmt in ["%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y"]:
-            try:
-                return datetime.strptime(dol, fmt)
-            except ValueError:
-                continue
-        return None
+        return parse_dol_date(dol)
 
 
 # Global extractor instance (lazy-loaded)
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration.
+
+Puts the project root on sys.path once per session so the tests can import
+`src.*` modules without each test module adjusting the path itself.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
@@ -0,0 +1,56 @@
+"""
+Tests for the date_utils month arithmetic helpers.
+"""
+
+import unittest
+from datetime import datetime
+
+from src.utils.date_utils import add_months, whole_months_between, whole_years
+
+
+class TestAddMonths(unittest.TestCase):
+    """Tests for add_months function."""
+
+    def test_whole_years(self):
+        """Test adding whole years keeps the day and month."""
+        self.assertEqual(add_months(datetime(1862, 6, 24), 99 * 12), datetime(1961, 6, 24))
+
+    def test_clamps_to_month_end(self):
+        """Test a day missing from the target month is clamped to its last day."""
+        self.assertEqual(add_months(datetime(2000, 1, 31), 1), datetime(2000, 2, 29))
+        self.assertEqual(add_months(datetime(2000, 2, 29), 12), datetime(2001, 2, 28))
+
+    def test_negative_months(self):
+        """Test subtracting months across a year boundary."""
+        self.assertEqual(add_months(datetime(2000, 3, 31), -4), datetime(1999, 11, 30))
+
+
+class TestWholeMonthsBetween(unittest.TestCase):
+    """Tests for whole_months_between function."""
+
+    def test_forwards(self):
+        """Test a part month is truncated."""
+        self.assertEqual(whole_months_between(datetime(2000, 1, 15), datetime(2000, 3, 14)), 1)
+        self.assertEqual(whole_months_between(datetime(2000, 1, 15), datetime(2000, 3, 15)), 2)
+
+    def test_backwards(self):
+        """Test an end before the start gives a negative count truncated towards zero."""
+        self.assertEqual(whole_months_between(datetime(2000, 3, 15), datetime(2000, 1, 16)), -1)
+
+    def test_month_end(self):
+        """Test 31 January to 29 February counts as one month, as relativedelta does."""
+        self.assertEqual(whole_months_between(datetime(2000, 1, 31), datetime(2000, 2, 29)), 1)
+
+
+class TestWholeYears(unittest.TestCase):
+    """Tests for whole_years function."""
+
+    def test_truncates_towards_zero(self):
+        """Test positive and negative month counts are truncated towards zero."""
+        self.assertEqual(whole_years(23), 1)
+        self.assertEqual(whole_years(24), 2)
+        self.assertEqual(whole_years(-23), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
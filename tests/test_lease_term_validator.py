@@ -5,12 +5,7 @@ Uses the same test data from test_regex_extractors.py TestParseLeaseTerm.
 """
 
 import unittest
-import sys
 from datetime import datetime
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.utils.lease_term_validator import (
     validate_lease_term,
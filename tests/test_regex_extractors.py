@@ -2,67 +2,66 @@
 Unit tests for regex_extractors module.
 """
 
+import pickle
 import unittest
-import sys
+from unittest import mock
 from datetime import datetime
-from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import pandas as pd
 
-from src.utils.regex_extractors import parse_lease_term, parse_date, parse_word_number, parse_fractional_years, resolve_special_day, parse_dol_date, parse_month_year_date
+from src.utils import regex_extractors
+from src.utils.regex_extractors import LeaseTerm, parse_lease_term, parse_lease_terms, parse_date, parse_word_number, parse_fractional_years, resolve_special_day, parse_dol_date, parse_month_year_date, normalise_term_str
+
+# Date of lease shared by the dol-based tests, and the start date it parses to
+DOL = "01-01-1900"
+DOL_DATE = datetime(1900, 1, 1)
 
 
 class TestParseDateFunction(unittest.TestCase):
     """Tests for the parse_date helper function."""
 
-    def test_parse_full_month_name(self):
-        """Test parsing with full month name."""
-        result = parse_date("24", "June", "1862")
-        self.assertEqual(result, datetime(1862, 6, 24))
-
-    def test_parse_abbreviated_month(self):
-        """Test parsing with abbreviated month name."""
-        result = parse_date("1", "Apr", "1982")
-        self.assertEqual(result, datetime(1982, 4, 1))
+    # (day, month, year, expected)
+    CASES = [
+        ("24", "June", "1862", datetime(1862, 6, 24)),       # Full month name
+        ("1", "Apr", "1982", datetime(1982, 4, 1)),          # Abbreviated month name
+        ("29", "9", "1909", datetime(1909, 9, 29)),          # Numeric month (from date like 29.9.1909)
+        ("invalid", "invalid", "invalid", None),             # Invalid date
+    ]
 
-    def test_parse_numeric_month(self):
-        """Test parsing with numeric month (from date like 29.9.1909)."""
-        result = parse_date("29", "9", "1909")
-        self.assertEqual(result, datetime(1909, 9, 29))
-
-    def test_parse_invalid_date(self):
-        """Test parsing invalid date returns None."""
-        result = parse_date("invalid", "invalid", "invalid")
-        self.assertIsNone(result)
+    def test_parse_date(self):
+        """Test parsing date components into a datetime."""
+        for day, month, year, expected in self.CASES:
+            with self.subTest(day=day, month=month, year=year):
+                self.assertEqual(parse_date(day, month, year), expected)
 
 
 class TestParseWordNumberFunction(unittest.TestCase):
     """Tests for the parse_word_number helper function."""
 
-    def test_parse_digit_string(self):
-        """Test parsing digit strings."""
-        self.assertEqual(parse_word_number("99"), 99)
-        self.assertEqual(parse_word_number("10"), 10)
+    # (word, expected)
+    CASES = [
+        ("99", 99),                 # Digit strings
+        ("10", 10),
+        ("98~", 98),                # Digits with special characters like ~
+        ("one", 1),                 # Word numbers
+        ("ten", 10),
+        ("Twenty", 20),
+        ("invalid", None),          # Invalid word
+    ]
 
-    def test_parse_digit_with_tilde(self):
-        """Test parsing digits with special characters like ~."""
-        self.assertEqual(parse_word_number("98~"), 98)
-
-    def test_parse_word_numbers(self):
-        """Test parsing word numbers."""
-        self.assertEqual(parse_word_number("one"), 1)
-        self.assertEqual(parse_word_number("ten"), 10)
-        self.assertEqual(parse_word_number("Twenty"), 20)
-
-    def test_parse_invalid_word(self):
-        """Test parsing invalid word returns None."""
-        self.assertIsNone(parse_word_number("invalid"))
+    def test_parse_word_number(self):
+        """Test converting digit strings and word numbers to integers."""
+        for word, expected in self.CASES:
+            with self.subTest(word=word):
+                self.assertEqual(parse_word_number(word), expected)
 
 
 class TestParseLeaseTerm(unittest.TestCase):
     """Tests for the main parse_lease_term function."""
 
+    def setUp(self):
+        regex_extractors.clear_caches()
+
     def test_years_from_date_basic(self):
         """Test: '99 years from 24 June 1862'"""
         result = parse_lease_term("99 years from 24 June 1862")
@@ -231,6 +230,27 @@ class TestParseLeaseTerm(unittest.TestCase):
         self.assertEqual(result['start_date'], datetime(1862, 6, 24))
         self.assertEqual(result['tenure_years'], 99)
 
+    def test_normalization_non_ascii_fixes(self):
+        """Test normalization still applies case-insensitive fixes to non-ASCII terms"""
+        self.assertEqual(normalise_term_str("99 years from and ıncluding on 1 June 1862"),
+                         "99 years from and including 1 June 1862")
+        self.assertEqual(normalise_term_str("½ 99 years FORM 31 June 1862"),
+                         "99 years from 30 June 1862")
+
+    def test_normalization_unicode_digits(self):
+        """Test non-ASCII decimal digits parse the same with re and RE2: '٩٩ years from ٢٤ June ١٨٦٢'"""
+        result = parse_lease_term("٩٩ years from ٢٤ June ١٨٦٢")
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result['start_date'], datetime(1862, 6, 24))
+        self.assertEqual(result['expiry_date'], datetime(1961, 6, 24))
+        self.assertEqual(result['tenure_years'], 99)
+
+        result = parse_lease_term("٩٩٩ years", dol="01-01-1900")
+        self.assertIsNotNone(result)
+        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['tenure_years'], 999)
+
     # --- New test cases for fractional years ---
     def test_fractional_years_three_quarters(self):
         """Test: '97 3/4 years from 25 March 1866'"""
@@ -806,174 +826,350 @@ class TestParseLeaseTerm(unittest.TestCase):
         self.assertEqual(result['tenure_years'], 20)
 
 
-class TestParseFractionalYears(unittest.TestCase):
-    """Tests for the parse_fractional_years helper function."""
+class TestLeaseTermResult(unittest.TestCase):
+    """Tests for the LeaseTerm result returned by parse_lease_term."""
 
-    def test_parse_three_quarters(self):
-        """Test parsing '97 3/4'."""
-        result = parse_fractional_years("97 3/4")
-        self.assertEqual(result, 97.75)
-
-    def test_parse_one_quarter(self):
-        """Test parsing '54 1/4'."""
-        result = parse_fractional_years("54 1/4")
-        self.assertEqual(result, 54.25)
-
-    def test_parse_and_half(self):
-        """Test parsing '65 and half'."""
-        result = parse_fractional_years("65 and half")
-        self.assertEqual(result, 65.5)
-
-    def test_parse_and_a_half(self):
-        """Test parsing '95 and a half'."""
-        result = parse_fractional_years("95 and a half")
-        self.assertEqual(result, 95.5)
-
-    def test_parse_and_a_quarter(self):
-        """Test parsing '52 and a quarter'."""
-        result = parse_fractional_years("52 and a quarter")
-        self.assertEqual(result, 52.25)
-
-    def test_parse_plain_number(self):
-        """Test parsing plain number '99'."""
-        result = parse_fractional_years("99")
-        self.assertEqual(result, 99.0)
-
-    def test_parse_empty_string(self):
-        """Test parsing empty string returns None."""
-        result = parse_fractional_years("")
-        self.assertIsNone(result)
+    def test_attribute_and_key_access(self):
+        """Test fields are readable both as attributes and as dict-style keys."""
+        result = parse_lease_term("99 years from 24 June 1862")
 
-    def test_parse_none(self):
-        """Test parsing None returns None."""
-        result = parse_fractional_years(None)
-        self.assertIsNone(result)
+        self.assertIsInstance(result, LeaseTerm)
+        self.assertEqual(result.start_date, datetime(1862, 6, 24))
+        self.assertEqual(result['start_date'], result.start_date)
+        self.assertEqual(result.extractor, 'regex')
+        self.assertIn('tenure_years', result)
+        self.assertNotIn('source', result)
+        self.assertIsNone(result.get('source'))
+        with self.assertRaises(KeyError):
+            result['source']
+
+    def test_dict_conversion(self):
+        """Test dict(result) gives the original dictionary shape."""
+        result = parse_lease_term("99 years from 24 June 1862")
 
+        self.assertEqual(dict(result), {
+            'start_date': datetime(1862, 6, 24),
+            'expiry_date': datetime(1961, 6, 24),
+            'tenure_years': 99,
+            'extractor': 'regex',
+        })
 
-class TestResolveSpecialDay(unittest.TestCase):
-    """Tests for the resolve_special_day helper function."""
+    def test_no_instance_dict(self):
+        """Test results are slotted (no per-instance __dict__) and immutable."""
+        result = parse_lease_term("99 years from 24 June 1862")
 
-    def test_christmas_day(self):
-        """Test resolving Christmas Day."""
-        result = resolve_special_day("Christmas Day", "1900")
-        self.assertEqual(result, datetime(1900, 12, 25))
-
-    def test_christmas(self):
-        """Test resolving Christmas."""
-        result = resolve_special_day("Christmas", "1950")
-        self.assertEqual(result, datetime(1950, 12, 25))
-
-    def test_midsummer_day(self):
-        """Test resolving Midsummer Day."""
-        result = resolve_special_day("Midsummer Day", "1852")
-        self.assertEqual(result, datetime(1852, 6, 24))
-
-    def test_midsummer(self):
-        """Test resolving Midsummer."""
-        result = resolve_special_day("Midsummer", "1881")
-        self.assertEqual(result, datetime(1881, 6, 24))
-
-    def test_lady_day(self):
-        """Test resolving Lady Day."""
-        result = resolve_special_day("Lady Day", "1900")
-        self.assertEqual(result, datetime(1900, 3, 25))
-
-    def test_michaelmas(self):
-        """Test resolving Michaelmas."""
-        result = resolve_special_day("Michaelmas", "1900")
-        self.assertEqual(result, datetime(1900, 9, 29))
-
-    def test_michaelmas_day(self):
-        """Test resolving Michaelmas Day."""
-        result = resolve_special_day("Michaelmas Day", "1900")
-        self.assertEqual(result, datetime(1900, 9, 29))
-
-    def test_case_insensitive(self):
-        """Test case insensitivity."""
-        result = resolve_special_day("christmas day", "1900")
-        self.assertEqual(result, datetime(1900, 12, 25))
-
-    def test_unknown_day(self):
-        """Test unknown day returns None."""
-        result = resolve_special_day("Unknown Day", "1900")
-        self.assertIsNone(result)
+        self.assertFalse(hasattr(result, '__dict__'))
+        with self.assertRaises(AttributeError):
+            result.tenure_years = 100
 
-    def test_invalid_year(self):
-        """Test invalid year returns None."""
-        result = resolve_special_day("Christmas Day", "invalid")
-        self.assertIsNone(result)
+    def test_repeat_calls_are_cached(self):
+        """Test identical inputs return the same cached result object."""
+        first = parse_lease_term("99 years from 24 June 1862", dol="16-10-1866")
 
-    def test_empty_inputs(self):
-        """Test empty inputs return None."""
-        self.assertIsNone(resolve_special_day("", "1900"))
-        self.assertIsNone(resolve_special_day("Christmas Day", ""))
-        self.assertIsNone(resolve_special_day(None, "1900"))
-        self.assertIsNone(resolve_special_day("Christmas Day", None))
+        self.assertIs(parse_lease_term("99 years from 24 June 1862", dol="16-10-1866"), first)
 
+    def test_clear_caches(self):
+        """Test clearing the caches makes the next call parse afresh."""
+        first = parse_lease_term("99 years from 24 June 1862")
+        regex_extractors.clear_caches()
 
-class TestParseDolDateFunction(unittest.TestCase):
-    """Tests for the parse_dol_date helper function."""
+        second = parse_lease_term("99 years from 24 June 1862")
+        self.assertIsNot(second, first)
+        self.assertEqual(second, first)
 
-    def test_parse_dd_mm_yyyy_hyphen(self):
-        """Test parsing DD-MM-YYYY format."""
-        result = parse_dol_date("16-10-1866")
-        self.assertEqual(result, datetime(1866, 10, 16))
+    def test_same_term_different_dols(self):
+        """Test a term shared by leases with different dols still takes each lease's dol."""
+        first = parse_lease_term("999 years from the date of the lease", dol="16-10-1866")
+        second = parse_lease_term("999 years from the date of the lease", dol="01-02-1950")
 
-    def test_parse_dd_mm_yyyy_slash(self):
-        """Test parsing DD/MM/YYYY format."""
-        result = parse_dol_date("16/10/1866")
-        self.assertEqual(result, datetime(1866, 10, 16))
+        self.assertEqual(first['start_date'], datetime(1866, 10, 16))
+        self.assertEqual(second['start_date'], datetime(1950, 2, 1))
+        # A dol-free match is shared by every dol
+        self.assertIs(parse_lease_term("99 years from 24 June 1862", dol="01-02-1950"),
+                      parse_lease_term("99 years from 24 June 1862", dol="16-10-1866"))
 
-    def test_parse_dd_mm_yyyy_dot(self):
-        """Test parsing DD.MM.YYYY format."""
-        result = parse_dol_date("16.10.1866")
-        self.assertEqual(result, datetime(1866, 10, 16))
+    def test_pickle_round_trip(self):
+        """Test the result survives pickling for multiprocessing workers."""
+        result = parse_lease_term("99 years from 24 June 1862")
 
-    def test_parse_with_whitespace(self):
-        """Test parsing with leading/trailing whitespace."""
-        result = parse_dol_date("  16-10-1866  ")
-        self.assertEqual(result, datetime(1866, 10, 16))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+
+class TestParseLeaseTerms(unittest.TestCase):
+    """Tests for the parse_lease_terms Series helper."""
+
+    def test_matches_parse_lease_term(self):
+        """Test each row matches a direct parse_lease_term call, keeping the input index."""
+        terms = pd.Series(
+            ["99 years from 24 June 1862", "999 years", "99 years from 24 June 1862", "not a lease", None],
+            index=[10, 11, 12, 13, 14],
+        )
+        dols = pd.Series(["16-10-1866", "15-06-1950", None, None, None], index=[10, 11, 12, 13, 14])
+
+        result = parse_lease_terms(terms, dols)
+
+        self.assertEqual(list(result.index), [10, 11, 12, 13, 14])
+        self.assertEqual(list(result.columns), ['start_date', 'expiry_date', 'tenure_years', 'extractor'])
+        for idx in [10, 11, 12]:
+            expected = parse_lease_term(terms[idx], dol=dols[idx])
+            self.assertEqual(tuple(result.loc[idx]), tuple(expected))
+        self.assertIsNone(result.loc[13, 'start_date'])
+        self.assertIsNone(result.loc[14, 'extractor'])
+
+    def test_without_dols(self):
+        """Test terms needing a date of lease are left empty when no dols are given."""
+        result = parse_lease_terms(pd.Series(["99 years from 24 June 1862", "999 years"]))
+
+        self.assertEqual(result.loc[0, 'start_date'], datetime(1862, 6, 24))
+        self.assertIsNone(result.loc[1, 'start_date'])
+
+    def test_out_of_range_date(self):
+        """Test a term whose dates fall outside datetime's range does not abort the batch."""
+        result = parse_lease_terms(pd.Series([
+            "10,000 years from 25 March 1926",
+            "1 year less 400 days from 1 January 0001",
+            "99 years from 24 June 1862",
+        ]))
+
+        self.assertIsNone(result.loc[0, 'expiry_date'])
+        self.assertIsNone(result.loc[1, 'expiry_date'])
+        self.assertEqual(result.loc[2, 'expiry_date'], datetime(1961, 6, 24))
+
+
+@unittest.skipIf(regex_extractors.hyperscan is None, "hyperscan not installed")
+class TestPatternPrefilter(unittest.TestCase):
+    """Tests that the Hyperscan prefilter agrees with searching each pattern."""
+
+    TERMS = [
+        "99 years from 24 June 1862",
+        "215 years beginning on and including 24 June 1986 and ending on and including 23 June 2201",
+        "Expiring on 21 October 2115 from 22 October 1990",
+        "999 years from the date of the lease",
+        "For a term expiring on the 31 day of March 2122",
+        "999 (less 10 days)",
+        "18 April 1997",
+        "not a lease term",
+    ]
+
+    def test_matches_individual_searches(self):
+        """Test the single scan reports exactly the patterns that search() would find."""
+        for term in map(str.lower, self.TERMS):
+            with self.subTest(term=term):
+                expected = {p for p in regex_extractors.LEASE_TERM_PATTERNS if p.search(term)}
+                self.assertEqual(regex_extractors._matching_patterns(term), expected)
+
+
+class TestKeywordPrefilter(unittest.TestCase):
+    """Tests for the keyword prefilter used when Hyperscan is not installed."""
+
+    TERMS = TestPatternPrefilter.TERMS + [
+        "52 and a quarter years less 10 days from 25 March 1906",
+        "From 25 May 1988 for a term of 212 years",
+        "Commencing on 28 July 2024 and expiring 50 years thereafter",
+        "999 and 1 day from 28 March 1988",
+        "From and including 30 September to and including 29 September 2031",
+    ]
+
+    def test_keeps_every_matching_pattern(self):
+        """Test no pattern that matches a term is ruled out by its keyword."""
+        with mock.patch.object(regex_extractors, 'hyperscan', None):
+            for term in map(str.lower, self.TERMS):
+                with self.subTest(term=term):
+                    expected = {p for p in regex_extractors.LEASE_TERM_PATTERNS if p.search(term)}
+                    self.assertLessEqual(expected, regex_extractors._matching_patterns(term))
+
+
+class TestHandlerTables(unittest.TestCase):
+    """Tests for the ordered (pattern, handler) tables parse_lease_term dispatches on."""
+
+    def test_tables_cover_patterns_in_order(self):
+        """Test the handler tables try patterns in LEASE_TERM_PATTERNS order, so the prefilter sees them all."""
+        table_patterns = [pattern for pattern, _ in
+                          regex_extractors.LEASE_TERM_HANDLERS + regex_extractors.DOL_TERM_HANDLERS]
+        self.assertEqual(table_patterns, list(regex_extractors.LEASE_TERM_PATTERNS))
+
+
+class TestPlainYearsFastPaths(unittest.TestCase):
+    """Tests that the regex-free plain "N years ..." paths agree with the pattern tables."""
+
+    # "N years from D Month YYYY" terms _parse_plain_years_from covers
+    FROM_DATE_TERMS = [
+        "99 years from 24 june 1862",
+        "1 year from 1 1 2000",
+        "99 years from 24 jun 1862",
+    ]
+
+    # One term per DOL_YEARS_TAILS shape, all covered by _parse_plain_years_from_dol
+    FROM_DOL_TERMS = [
+        "999 years",
+        "1 year",
+        "125 years from the date of the lease",
+        "99 years from the date of this lease",
+        "99 years from date of lease",
+        "150 years commencing on the date of the lease",
+    ]
+
+    def test_from_date_matches_patterns(self):
+        """Test each covered start date term parses to the result the pattern table gives."""
+        for term in self.FROM_DATE_TERMS:
+            with self.subTest(term=term):
+                expected = regex_extractors._first_result(regex_extractors.LEASE_TERM_HANDLERS, term, None)
+                result = regex_extractors._parse_plain_years_from(term)
+                self.assertIsNotNone(result)
+                self.assertEqual(result, expected)
+
+    def test_from_dol_matches_patterns(self):
+        """Test each covered dol term parses to the result the dol pattern table gives."""
+        for term in self.FROM_DOL_TERMS:
+            with self.subTest(term=term):
+                expected = regex_extractors._first_result(regex_extractors.DOL_TERM_HANDLERS, term, None, DOL_DATE)
+                result = regex_extractors._parse_plain_years_from_dol(term, DOL_DATE)
+                self.assertIsNotNone(result)
+                self.assertEqual(result, expected)
+
+    def test_expiry_out_of_range(self):
+        """Test an expiry beyond datetime's range raises on both the fast path and the patterns."""
+        term = "125000 years from 25 march 1926"
+        with self.assertRaises(ValueError):
+            regex_extractors._parse_plain_years_from(term)
+        with self.assertRaises(ValueError):
+            regex_extractors._first_result(regex_extractors.LEASE_TERM_HANDLERS, term, None)
+
+    def test_invalid_date_and_zero_years(self):
+        """Test an impossible start date or a zero tenure is parsed by neither path."""
+        for term in ["99 years from 31 february 1862", "0 years from 24 june 1862"]:
+            with self.subTest(term=term):
+                self.assertIsNone(regex_extractors._parse_plain_years_from(term))
+                self.assertIsNone(regex_extractors._first_result(regex_extractors.LEASE_TERM_HANDLERS, term, None))
+        self.assertIsNone(regex_extractors._parse_plain_years_from_dol("0 years", DOL_DATE))
+
+    def test_other_shapes_fall_through(self):
+        """Test wording the fast paths do not cover is left to the patterns."""
+        for term in ["99 years less 3 days from 24 june 1862", "99 years from christmas day 1900",
+                     "99 years from 24.6.1862", "a term of 99 years from 24 june 1862"]:
+            with self.subTest(term=term):
+                self.assertIsNone(regex_extractors._parse_plain_years_from(term))
+        for term in ["999 years less 6 days", "a term of 999 years", "999 (less 10 days)",
+                     "125 years from and including", "ninety nine years"]:
+            with self.subTest(term=term):
+                self.assertIsNone(regex_extractors._parse_plain_years_from_dol(term, DOL_DATE))
+
+
+class TestCalculateTenureYears(unittest.TestCase):
+    """Tests for the _calculate_tenure_years helper function."""
+
+    # (start_date, expiry_date, expected)
+    CASES = [
+        (datetime(2022, 5, 3), datetime(2047, 5, 2), 25),     # one day short rounds up
+        (datetime(2020, 6, 24), datetime(2025, 6, 23), 5),
+        (datetime(2020, 1, 1), datetime(2020, 12, 2), 1),     # 11 months and a day rounds up
+        (datetime(2020, 1, 1), datetime(2020, 11, 1), 0),
+        (datetime(2020, 1, 31), datetime(2021, 2, 28), 1),
+        (datetime(2020, 2, 29), datetime(2021, 2, 28), 1),
+    ]
+
+    def test_cases(self):
+        """Test whole years between start and expiry, rounding up a term one day or month short."""
+        for start_date, expiry_date, expected in self.CASES:
+            with self.subTest(start_date=start_date, expiry_date=expiry_date):
+                self.assertEqual(regex_extractors._calculate_tenure_years(start_date, expiry_date), expected)
 
-    def test_parse_empty_string(self):
-        """Test parsing empty string returns None."""
-        self.assertIsNone(parse_dol_date(""))
 
-    def test_parse_none(self):
-        """Test parsing None returns None."""
-        self.assertIsNone(parse_dol_date(None))
+class TestParseFractionalYears(unittest.TestCase):
+    """Tests for the parse_fractional_years helper function."""
 
-    def test_parse_invalid_format(self):
-        """Test parsing invalid format returns None."""
-        self.assertIsNone(parse_dol_date("invalid"))
+    # (years_str, expected)
+    CASES = [
+        ("97 3/4", 97.75),
+        ("54 1/4", 54.25),
+        ("65 and half", 65.5),
+        ("95 and a half", 95.5),
+        ("52 and a quarter", 52.25),
+        ("99", 99.0),               # Plain number
+        ("", None),                 # Empty string
+        (None, None),
+    ]
+
+    def test_parse_fractional_years(self):
+        """Test parsing whole and fractional year strings."""
+        for years_str, expected in self.CASES:
+            with self.subTest(years_str=years_str):
+                self.assertEqual(parse_fractional_years(years_str), expected)
 
 
-class TestParseMonthYearDate(unittest.TestCase):
-    """Tests for the parse_month_year_date helper function."""
+class TestResolveSpecialDay(unittest.TestCase):
+    """Tests for the resolve_special_day helper function."""
 
-    def test_parse_month_name_year(self):
-        """Test parsing with full month name and year."""
-        result = parse_month_year_date("December", "2023")
-        self.assertEqual(result, datetime(2023, 12, 1))
+    # (day_name, year, expected)
+    CASES = [
+        ("Christmas Day", "1900", datetime(1900, 12, 25)),
+        ("Christmas", "1950", datetime(1950, 12, 25)),
+        ("Midsummer Day", "1852", datetime(1852, 6, 24)),
+        ("Midsummer", "1881", datetime(1881, 6, 24)),
+        ("Lady Day", "1900", datetime(1900, 3, 25)),
+        ("Michaelmas", "1900", datetime(1900, 9, 29)),
+        ("Michaelmas Day", "1900", datetime(1900, 9, 29)),
+        ("christmas day", "1900", datetime(1900, 12, 25)),   # Case insensitive
+        ("Unknown Day", "1900", None),                        # Unknown day
+        ("Christmas Day", "invalid", None),                   # Invalid year
+        ("", "1900", None),                                   # Empty inputs
+        ("Christmas Day", "", None),
+        (None, "1900", None),
+        ("Christmas Day", None, None),
+    ]
+
+    def test_resolve_special_day(self):
+        """Test resolving special day names to dates."""
+        for day_name, year, expected in self.CASES:
+            with self.subTest(day_name=day_name, year=year):
+                self.assertEqual(resolve_special_day(day_name, year), expected)
 
-    def test_parse_abbreviated_month_year(self):
-        """Test parsing with abbreviated month name and year."""
-        result = parse_month_year_date("Jan", "2020")
-        self.assertEqual(result, datetime(2020, 1, 1))
 
-    def test_parse_numeric_month_year(self):
-        """Test parsing with numeric month and year."""
-        result = parse_month_year_date("6", "2025")
-        self.assertEqual(result, datetime(2025, 6, 1))
+class TestParseDolDateFunction(unittest.TestCase):
+    """Tests for the parse_dol_date helper function."""
+
+    # (dol, expected)
+    CASES = [
+        ("16-10-1866", datetime(1866, 10, 16)),      # DD-MM-YYYY
+        ("16/10/1866", datetime(1866, 10, 16)),      # DD/MM/YYYY
+        ("16.10.1866", datetime(1866, 10, 16)),      # DD.MM.YYYY
+        ("  16-10-1866  ", datetime(1866, 10, 16)),  # Leading/trailing whitespace
+        ("", None),                                  # Empty string
+        (None, None),
+        ("invalid", None),                           # Invalid format
+    ]
+
+    def test_parse_dol_date(self):
+        """Test parsing date of lease strings."""
+        for dol, expected in self.CASES:
+            with self.subTest(dol=dol):
+                self.assertEqual(parse_dol_date(dol), expected)
+
+
+class TestParseMonthYearDate(unittest.TestCase):
+    """Tests for the parse_month_year_date helper function."""
 
-    def test_defaults_to_first_of_month(self):
-        """Test that day defaults to 1st of the month."""
-        result = parse_month_year_date("March", "1999")
-        self.assertEqual(result.day, 1)
+    # (month, year, expected) - day always defaults to the 1st of the month
+    CASES = [
+        ("December", "2023", datetime(2023, 12, 1)),     # Full month name
+        ("Jan", "2020", datetime(2020, 1, 1)),           # Abbreviated month name
+        ("6", "2025", datetime(2025, 6, 1)),             # Numeric month
+        ("March", "1999", datetime(1999, 3, 1)),
+    ]
+
+    def test_parse_month_year_date(self):
+        """Test parsing month and year into the first day of the month."""
+        for month, year, expected in self.CASES:
+            with self.subTest(month=month, year=year):
+                self.assertEqual(parse_month_year_date(month, year), expected)
 
 
 class TestLeaseTermWithDol(unittest.TestCase):
     """Tests for parse_lease_term function with date of lease (dol) parameter."""
 
+    def setUp(self):
+        regex_extractors.clear_caches()
+
     def test_years_from_date_of_lease(self):
         """Test: '999 years from the date of the lease' with dol"""
         result = parse_lease_term("999 years from the date of the lease", dol="16-10-1866")
@@ -986,10 +1182,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_years_from_date_of_lease_without_the(self):
         """Test: '125 years from date of lease' with dol"""
-        result = parse_lease_term("125 years from date of lease", dol="01-01-1900")
+        result = parse_lease_term("125 years from date of lease", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2025, 1, 1))
         self.assertEqual(result['tenure_years'], 125)
 
@@ -1032,10 +1228,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_term_of_years_expiring_on_and_including(self):
         """Test: 'term of years expiring on and including 31 December 2100' with dol"""
-        result = parse_lease_term("term of years expiring on and including 31 December 2100", dol="01-01-1900")
+        result = parse_lease_term("term of years expiring on and including 31 December 2100", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2100, 12, 31))
 
     def test_years_only_without_dol_returns_none(self):
@@ -1107,10 +1303,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_number_of_years_expiring_on(self):
         """Test: 'A number of years expiring on 31 December 2100' with dol"""
-        result = parse_lease_term("A number of years expiring on 31 December 2100", dol="01-01-1900")
+        result = parse_lease_term("A number of years expiring on 31 December 2100", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2100, 12, 31))
         # Rounds up - Dec 31 to Jan 1 is within 30 days
         self.assertEqual(result['tenure_years'], 201)
@@ -1160,10 +1356,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_term_expiring_on_uppercase(self):
         """Test: 'A term expiring on 1 January 2100' with dol (uppercase)"""
-        result = parse_lease_term("A term expiring on 1 January 2100", dol="01-01-1900")
+        result = parse_lease_term("A term expiring on 1 January 2100", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2100, 1, 1))
         self.assertEqual(result['tenure_years'], 200)
 
@@ -1208,10 +1404,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_years_less_days_dol(self):
         """Test: '999 years less 6 days' with dol (days ignored)"""
-        result = parse_lease_term("999 years less 6 days", dol="01-01-1900")
+        result = parse_lease_term("999 years less 6 days", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2899, 1, 1))
         self.assertEqual(result['tenure_years'], 999)
 
@@ -1222,10 +1418,10 @@ class TestLeaseTermWithDol(unittest.TestCase):
 
     def test_years_from_date_as_therein_mentioned(self):
         """Test: '900 years from the date as therein mentioned' with dol (normalizes to 'date of the lease')"""
-        result = parse_lease_term("900 years from the date as therein mentioned", dol="01-01-1900")
+        result = parse_lease_term("900 years from the date as therein mentioned", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2800, 1, 1))
         self.assertEqual(result['tenure_years'], 900)
 
@@ -1385,10 +1581,10 @@ class TestDolIncompletePatterns(unittest.TestCase):
 
     def test_years_from_incomplete(self):
         """Test: '125 years from' with dol"""
-        result = parse_lease_term("125 years from", dol="01-01-1900")
+        result = parse_lease_term("125 years from", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['tenure_years'], 125)
 
     def test_years_from_and_including_incomplete(self):
@@ -1448,10 +1644,10 @@ class TestDolExpiryPatterns(unittest.TestCase):
 
     def test_single_date_expiry(self):
         """Test: '18 April 1997' with dol (single date as expiry)"""
-        result = parse_lease_term("18 April 1997", dol="01-01-1900")
+        result = parse_lease_term("18 April 1997", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(1997, 4, 18))
         self.assertEqual(result['tenure_years'], 97)
 
@@ -1475,10 +1671,10 @@ class TestDolExpiryPatterns(unittest.TestCase):
 
     def test_for_residue_of_term_999_years(self):
         """Test: 'For the residue of the term of 999 years' with dol"""
-        result = parse_lease_term("For the residue of the term of 999 years", dol="01-01-1900")
+        result = parse_lease_term("For the residue of the term of 999 years", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2899, 1, 1))
         self.assertEqual(result['tenure_years'], 999)
 
@@ -1593,36 +1789,36 @@ class TestAdditionalDolPatterns(unittest.TestCase):
 
     def test_years_commencing_on_date_of_this_lease(self):
         """Test: '250 years commencing on the date of this lease' with dol"""
-        result = parse_lease_term("250 years commencing on the date of this lease", dol="01-01-1900")
+        result = parse_lease_term("250 years commencing on the date of this lease", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2150, 1, 1))
         self.assertEqual(result['tenure_years'], 250)
 
     def test_years_parenthetical_less_days(self):
         """Test: '999 (less 10 days)' with dol (parenthetical less days, ignored)"""
-        result = parse_lease_term("999 (less 10 days)", dol="01-01-1900")
+        result = parse_lease_term("999 (less 10 days)", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2899, 1, 1))
         self.assertEqual(result['tenure_years'], 999)
 
     def test_from_date_hereof_up_to_date(self):
         """Test: 'from and including the date hereof up to 13 March 2956' with dol"""
-        result = parse_lease_term("from and including the date hereof up to 13 March 2956", dol="01-01-1900")
+        result = parse_lease_term("from and including the date hereof up to 13 March 2956", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(2956, 3, 13))
 
     def test_from_date_of_lease_expiring_on(self):
         """Test: 'from the date of the lease and expiring on 1 February 3003' with dol"""
-        result = parse_lease_term("from the date of the lease and expiring on 1 February 3003", dol="01-01-1900")
+        result = parse_lease_term("from the date of the lease and expiring on 1 February 3003", dol=DOL)
 
         self.assertIsNotNone(result)
-        self.assertEqual(result['start_date'], datetime(1900, 1, 1))
+        self.assertEqual(result['start_date'], DOL_DATE)
         self.assertEqual(result['expiry_date'], datetime(3003, 2, 1))
 
     def test_parenthetical_less_days_for_typo(self):
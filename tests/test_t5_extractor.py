@@ -3,17 +3,40 @@ Unit tests for T5 extractor module.
 """
 
 import unittest
-import sys
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import MagicMock
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from types import SimpleNamespace
 
 from src.utils.t5_extractor import T5LeaseExtractor, parse_lease_term_t5, get_extractor
 
 
+class StubTokenizer:
+    """Tokenizer stand-in that decodes every output to the given strings."""
+
+    def __init__(self, outputs=()):
+        self.outputs = list(outputs)
+
+    def __call__(self, *args, **kwargs):
+        return SimpleNamespace(input_ids=None, attention_mask=None)
+
+    def decode(self, *args, **kwargs):
+        return self.outputs[0]
+
+    def batch_decode(self, *args, **kwargs):
+        return list(self.outputs)
+
+
+class StubModel:
+    """Model stand-in that counts generate calls."""
+
+    def __init__(self, batch_size=1):
+        self.batch_size = batch_size
+        self.generate_calls = 0
+
+    def generate(self, *args, **kwargs):
+        self.generate_calls += 1
+        return [None] * self.batch_size
+
+
 class TestT5ExtractorParseDateMethod(unittest.TestCase):
     """Tests for the _parse_date helper method."""
 
@@ -71,6 +94,11 @@ class TestT5ExtractorParseDateMethod(unittest.TestCase):
         result = self.extractor._parse_date("Michaelmas 1920")
         self.assertEqual(result, datetime(1920, 9, 29))
 
+    def test_parse_date_lady_day(self):
+        """Test parsing Lady Day special date, which needs the word "day"."""
+        self.assertEqual(self.extractor._parse_date("Lady Day 1850"), datetime(1850, 3, 25))
+        self.assertIsNone(self.extractor._parse_date("Lady 1850"))
+
 
 class TestT5ExtractorParseTenureMethod(unittest.TestCase):
     """Tests for the _parse_tenure helper method."""
@@ -222,24 +250,21 @@ class TestT5ExtractorParseDolDate(unittest.TestCase):
 class TestT5ExtractorExtractMethod(unittest.TestCase):
     """Integration tests for the extract method using mocked model."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mocked extractor once for all tests."""
+        cls.extractor = T5LeaseExtractor.__new__(T5LeaseExtractor)
+        cls.extractor.model_path = "./t5_model/trained_t5"
+        cls.extractor._max_length = 64
+
     def setUp(self):
-        """Set up mocked extractor for each test."""
-        self.extractor = T5LeaseExtractor.__new__(T5LeaseExtractor)
-        self.extractor.model_path = "./t5_model/trained_t5"
-        self.extractor._tokenizer = MagicMock()
-        self.extractor._model = MagicMock()
-        self.extractor._max_length = 64
+        """Give each test fresh stubs, so none sees another test's model output."""
+        self.extractor._tokenizer = StubTokenizer()
+        self.extractor._model = StubModel()
 
     def _mock_model_output(self, raw_output: str):
-        """Helper to set up mock for a specific output."""
-        # Mock tokenizer
-        mock_input = MagicMock()
-        mock_input.input_ids = MagicMock()
-        self.extractor._tokenizer.return_value = mock_input
-        self.extractor._tokenizer.decode.return_value = raw_output
-
-        # Mock model
-        self.extractor._model.generate.return_value = [MagicMock()]
+        """Helper to set up the stubs for a specific output."""
+        self.extractor._tokenizer = StubTokenizer([raw_output])
 
     def test_extract_years_from_date(self):
         """Test extracting '99 years from 24 June 1862'."""
@@ -314,6 +339,50 @@ class TestT5ExtractorExtractMethod(unittest.TestCase):
         self.assertEqual(result['extractor'], 't5')
 
 
+class TestT5ExtractorExtractBatchMethod(unittest.TestCase):
+    """Tests for the extract_batch method using mocked model."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mocked extractor once for all tests."""
+        cls.extractor = T5LeaseExtractor.__new__(T5LeaseExtractor)
+        cls.extractor.model_path = "./t5_model/trained_t5"
+        cls.extractor._max_length = 64
+
+    def setUp(self):
+        """Give each test fresh stubs, so none sees another test's model output."""
+        self.extractor._tokenizer = StubTokenizer()
+        self.extractor._model = StubModel()
+
+    def test_extract_batch_results_in_order(self):
+        """Test one generate call covers every term, results in input order."""
+        self.extractor._model = StubModel(batch_size=2)
+        self.extractor._tokenizer = StubTokenizer([
+            "24/06/1862Not specified99 years",
+            "999 years",
+        ])
+
+        results = self.extractor.extract_batch(
+            ["99 years from 24 June 1862", "", "999 years from the date of the lease"],
+            dols=[None, None, "25-03-1868"],
+        )
+
+        self.assertEqual(self.extractor._model.generate_calls, 1)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['start_date'], datetime(1862, 6, 24))
+        self.assertEqual(results[0]['expiry_date'], datetime(1961, 6, 24))
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]['start_date'], datetime(1868, 3, 25))
+        self.assertEqual(results[2]['expiry_date'], datetime(2867, 3, 25))
+
+    def test_extract_batch_all_empty(self):
+        """Test a batch with nothing to parse does not run the model."""
+        results = self.extractor.extract_batch(["", "   ", None])
+
+        self.assertEqual(results, [None, None, None])
+        self.assertEqual(self.extractor._model.generate_calls, 0)
+
+
 class TestGlobalExtractor(unittest.TestCase):
     """Tests for the global extractor instance and convenience function."""
 
@@ -8,6 +8,7 @@ from unittest.mock import Mock
 
 from src.enricher.update_mongo_from_csv import (
     is_residential,
+    residential_mask,
     process_chunk,
     ADDRESS_FIELD_MAPPING,
     RESIDENTIAL_CLASSES,
@@ -52,6 +53,21 @@ class TestIsResidential(unittest.TestCase):
         self.assertFalse(is_residential(pd.NA))
 
 
+class TestResidentialMask(unittest.TestCase):
+    """Tests for residential_mask function."""
+
+    def test_matches_is_residential(self):
+        """Test the column check agrees with is_residential value by value."""
+        values = ["R", "R     ", "RD123", "X", "P     ", "C", "CR01", "L", "", None, pd.NA]
+        mask = residential_mask(pd.Series(values, dtype=object))
+        self.assertEqual(mask.tolist(), [is_residential(value) for value in values])
+
+    def test_all_missing_column(self):
+        """Test a column read as all-NaN floats is not residential."""
+        mask = residential_mask(pd.Series([float("nan"), float("nan")]))
+        self.assertEqual(mask.tolist(), [False, False])
+
+
 class TestProcessChunk(unittest.TestCase):
     """Tests for process_chunk function."""
 
@@ -148,6 +164,25 @@ class TestProcessChunk(unittest.TestCase):
         self.assertEqual(result["updates"], 1)
         self.assertEqual(result["deletes"], 0)
 
+    def test_numeric_uid_with_gaps(self):
+        """Test that a nullable integer UID column skips its missing values."""
+        data = {
+            "uid": pd.array([101, None, 103], dtype="Int64"),
+            "class": ["R     ", "R     ", "C     "],
+            "uprn": [123456, 789012, 345678],
+        }
+        chunk = pd.DataFrame(data)
+
+        mock_collection = Mock()
+        mock_collection.bulk_write = Mock()
+
+        result = process_chunk(chunk, mock_collection)
+
+        self.assertEqual(result["updates"], 1)
+        self.assertEqual(result["deletes"], 1)
+        operations = mock_collection.bulk_write.call_args[0][0]
+        self.assertEqual([op._filter for op in operations], [{"uid": 101}, {"uid": 103}])
+
 
 class TestAddressFieldMapping(unittest.TestCase):
     """Tests for address field mapping."""